@@ -2,12 +2,31 @@
 Módulo Principal
 """
 
-# Importando as Bibliotecas 
+# Importando as Bibliotecas
 import sys
+import time
+import argparse
 sys.path.insert(0, "./src")
 
 from game import SpacialGame
 
 # Inicializando o Jogo
 if __name__ == '__main__':
-    SpacialGame()
+    parser = argparse.ArgumentParser(description="Spacial Game")
+    parser.add_argument("--headless", action="store_true", help="roda a simulação sem janela, áudio ou menus, com o piloto automático")
+    parser.add_argument("--ticks", type=int, default=10000, help="quantidade de ticks simulados no modo headless")
+    parser.add_argument("--seed", type=int, help="semente dos números aleatórios (mesma semente, mesmas partidas)")
+    parser.add_argument("--record", metavar="DIR", help="grava as teclas de cada partida no diretório DIR")
+    parser.add_argument("--replay", metavar="FILE", help="reproduz a partida gravada no arquivo FILE")
+    args = parser.parse_args()
+    options = {"seed": args.seed, "record": args.record, "replay": args.replay}
+
+    if args.headless:
+        start = time.perf_counter()
+        game = SpacialGame(headless=True, max_ticks=args.ticks, **options)
+        elapsed = time.perf_counter() - start
+        summary = game.summary
+        print(f"{summary['ticks']} ticks em {elapsed:.2f} s ({summary['ticks'] / elapsed:.0f} ticks/s)")
+        print(f"partidas: {summary['matches']}, scores: {summary['scores']}")
+    else:
+        SpacialGame(**options)
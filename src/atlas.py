@@ -0,0 +1,120 @@
+"""
+Módulo que gera o atlas de sprites: todos os quadros das sequências de imagens do
+jogo, já escalonados, empacotados em uma única imagem, acompanhada de um índice
+(JSON) com o retângulo de cada quadro.
+
+Deve ser executado a partir da raiz do repositório:
+
+    python src/atlas.py
+"""
+
+# Importando as bibliotecas
+import os
+import json
+
+import pygame as pg
+
+import constants as cst
+import resources as rs
+
+
+def collect_frames(images: list) -> list:
+    """
+    Função que lista os quadros (sem repetição) que entram no atlas.
+
+    Parameters
+    ----------
+    images : list
+        Lista de tuplas (caminhos, escala) das sequências de imagens.
+
+    Returns
+    -------
+    list
+        Lista de tuplas (caminho, escala) dos quadros.
+    """
+
+    frames = []
+    for paths, scale in images:
+        for path in paths:
+            frame = (path, tuple(scale))
+            # os cenários (jpg, sem transparência) continuam como arquivos separados
+            if path.endswith(".png") and frame not in frames:
+                frames.append(frame)
+    return frames
+
+
+def pack(sizes: list, max_width: int) -> tuple:
+    """
+    Função que posiciona os quadros em prateleiras (linhas), do mais alto para o mais baixo.
+
+    Parameters
+    ----------
+    sizes : list
+        Lista de tuplas (largura, altura) dos quadros.
+    max_width : int
+        Largura máxima do atlas.
+
+    Returns
+    -------
+    tuple
+        Lista de posições (x, y) na mesma ordem de sizes e o tamanho (largura, altura) do atlas.
+    """
+
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i][1], reverse=True)
+    positions = [None] * len(sizes)
+    x = y = shelf_height = width = 0
+    for i in order:
+        w, h = sizes[i]
+        if x + w > max_width: # nova prateleira
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += w
+        shelf_height = max(shelf_height, h)
+        width = max(width, x)
+    return positions, (width, y + shelf_height)
+
+
+def build_atlas(images: list, image_path: str, index_path: str, max_width: int) -> dict:
+    """
+    Função que gera o atlas e o seu índice.
+
+    Parameters
+    ----------
+    images : list
+        Lista de tuplas (caminhos, escala) das sequências de imagens.
+    image_path : str
+        Caminho da imagem do atlas (png).
+    index_path : str
+        Caminho do índice do atlas (json).
+    max_width : int
+        Largura máxima do atlas.
+
+    Returns
+    -------
+    dict
+        Índice do atlas.
+    """
+
+    frames = collect_frames(images)
+    surfaces = [rs.decode_image(path, scale) for path, scale in frames]
+    positions, size = pack([surface.get_size() for surface in surfaces], max_width)
+
+    atlas = pg.Surface(size, pg.SRCALPHA)
+    index = {"size": list(size), "frames": []}
+    for (path, scale), surface, pos in zip(frames, surfaces, positions):
+        atlas.blit(surface, pos)
+        index["frames"].append({"path": path, "scale": list(scale), "rect": [pos[0], pos[1], *surface.get_size()],
+                                "mtime": os.path.getmtime(path)})
+
+    os.makedirs(os.path.dirname(image_path), exist_ok=True)
+    pg.image.save(atlas, image_path)
+    with open(index_path, "w") as file:
+        json.dump(index, file, indent=1)
+    return index
+
+
+if __name__ == "__main__":
+    index = build_atlas(cst.PRELOAD_IMAGES, cst.ATLAS_IMAGE, cst.ATLAS_INDEX, cst.ATLAS_MAX_WIDTH)
+    print(f"{len(index['frames'])} quadros -> {cst.ATLAS_IMAGE} ({index['size'][0]}x{index['size'][1]})")
@@ -0,0 +1,294 @@
+"""
+Módulo que contém a detecção de colisões do jogo: a fase ampla (broad phase),
+baseada em uma grade uniforme (spatial hash) sobre a área de jogo, e o estágio
+de resolução que gera os contatos consumidos pelas regras do jogo.
+"""
+
+# Importando as bibliotecas
+import time
+from collections import namedtuple
+
+import pygame as pg
+
+
+# Contato entre dois sprites: tipo do par de grupos e os sprites envolvidos
+Contact = namedtuple("Contact", ["kind", "a", "b"])
+
+
+class SpatialHash:
+    """
+    Classe que indexa os sprites em células de uma grade uniforme, de forma que
+    cada teste de colisão só compare sprites que dividem alguma célula.
+    """
+
+    def __init__(self, cell_size: int) -> None:
+        """
+        Método construtor da classe SpatialHash.
+
+        Parameters
+        ----------
+        cell_size : int
+            Tamanho (em pixels) do lado de cada célula da grade.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__cell_size = cell_size
+        self.__indexes = {} # grade de cada grupo já indexado no tick: id(grupo) -> {(cx, cy): [sprites]}
+
+    def clear(self) -> None:
+        """
+        Método que descarta a grade do tick anterior (deve ser chamado uma vez por tick,
+        depois que os sprites se movimentaram).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__indexes.clear()
+
+    def forget(self, group: pg.sprite.AbstractGroup) -> None:
+        """
+        Método que descarta a grade de um grupo (por exemplo, quando um sprite é criado
+        no grupo depois que a grade foi construída); ela é refeita na próxima consulta.
+
+        Parameters
+        ----------
+        group : pg.sprite.AbstractGroup
+            Grupo de sprites.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__indexes.pop(id(group), None)
+
+    def __cells(self, rect: pg.Rect):
+        """
+        Método que gera as células da grade cobertas por um retângulo.
+
+        Parameters
+        ----------
+        rect : pg.Rect
+            Retângulo do sprite.
+
+        Returns
+        -------
+        generator
+            Coordenadas (cx, cy) das células.
+        """
+
+        size = self.__cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield cx, cy
+
+    def __index(self, group: pg.sprite.AbstractGroup) -> dict:
+        """
+        Método que devolve a grade de um grupo, construindo-a na primeira consulta do tick.
+
+        Parameters
+        ----------
+        group : pg.sprite.AbstractGroup
+            Grupo de sprites.
+
+        Returns
+        -------
+        dict
+            Grade do grupo: (cx, cy) -> lista de sprites.
+        """
+
+        index = self.__indexes.get(id(group))
+        if index is None:
+            index = {}
+            for sprite in group.sprites():
+                for cell in self.__cells(sprite.rect):
+                    index.setdefault(cell, []).append(sprite)
+            self.__indexes[id(group)] = index
+        return index
+
+    def spritecollide(self, sprite: pg.sprite.Sprite, group: pg.sprite.AbstractGroup, dokill: bool, collided=pg.sprite.collide_mask) -> list:
+        """
+        Método equivalente a pg.sprite.spritecollide, usando a grade como fase ampla.
+
+        Parameters
+        ----------
+        sprite : pg.sprite.Sprite
+            Sprite testado.
+        group : pg.sprite.AbstractGroup
+            Grupo contra o qual o sprite é testado.
+        dokill : bool
+            Se verdadeiro, os sprites do grupo atingidos são destruídos.
+        collided : callable (Opcional)
+            Teste fino (narrow phase) de colisão entre dois sprites.
+
+        Returns
+        -------
+        list
+            Lista de sprites do grupo que colidiram com o sprite.
+        """
+
+        index = self.__index(group)
+        rect = sprite.rect
+        seen = set()
+        hits = []
+        for cell in self.__cells(rect):
+            for other in index.get(cell, ()):
+                if other in seen:
+                    continue
+                seen.add(other)
+                # sprites destruídos durante o tick continuam na grade, mas não no grupo
+                if group.has(other) and rect.colliderect(other.rect) and collided(sprite, other):
+                    hits.append(other)
+
+        if dokill:
+            for other in hits:
+                other.kill()
+        return hits
+
+    def groupcollide(self, groupa: pg.sprite.AbstractGroup, groupb: pg.sprite.AbstractGroup, dokilla: bool, dokillb: bool, collided=pg.sprite.collide_mask) -> dict:
+        """
+        Método equivalente a pg.sprite.groupcollide, usando a grade como fase ampla.
+
+        Parameters
+        ----------
+        groupa : pg.sprite.AbstractGroup
+            Primeiro grupo de sprites.
+        groupb : pg.sprite.AbstractGroup
+            Segundo grupo de sprites (é o grupo indexado na grade).
+        dokilla : bool
+            Se verdadeiro, os sprites do primeiro grupo que colidirem são destruídos.
+        dokillb : bool
+            Se verdadeiro, os sprites do segundo grupo que colidirem são destruídos.
+        collided : callable (Opcional)
+            Teste fino (narrow phase) de colisão entre dois sprites.
+
+        Returns
+        -------
+        dict
+            Dicionário sprite do primeiro grupo -> lista de sprites do segundo grupo.
+        """
+
+        crashed = {}
+        for sprite in groupa.sprites():
+            hits = self.spritecollide(sprite, groupb, dokillb, collided)
+            if hits:
+                crashed[sprite] = hits
+                if dokilla:
+                    sprite.kill()
+        return crashed
+
+
+class CollisionResolver:
+    """
+    Classe que calcula, uma única vez por tick, as colisões de todos os pares de
+    grupos registrados e as entrega como uma lista de contatos. Os contatos são
+    calculados antes das regras do tick: um par cujo grupo ganhe um sprite durante
+    as regras deve ser recalculado (refresh) para que ele colida no mesmo tick.
+    """
+
+    def __init__(self, spatial_hash: SpatialHash, pairs: list) -> None:
+        """
+        Método construtor da classe CollisionResolver.
+
+        Parameters
+        ----------
+        spatial_hash : SpatialHash
+            Grade usada como fase ampla.
+        pairs : list
+            Lista de tuplas (tipo, grupo a, grupo b) testadas a cada tick.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__spatial_hash = spatial_hash
+        self.__pairs = pairs
+        self.__kinds = {kind: (groupa, groupb) for kind, groupa, groupb in pairs}
+        self.__contacts = []
+
+        # medições do custo das colisões
+        self.last_time = 0.0 # tempo (s) gasto no último tick
+        self.total_time = 0.0 # tempo (s) acumulado
+        self.ticks = 0
+
+    def resolve(self) -> list:
+        """
+        Método que calcula os contatos de todos os pares registrados (sem destruir sprites).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        list
+            Lista de contatos, na ordem dos pares registrados.
+        """
+
+        start = time.perf_counter()
+
+        self.__spatial_hash.clear()
+        self.__contacts = []
+        for kind, groupa, groupb in self.__pairs:
+            for sprite, hits in self.__spatial_hash.groupcollide(groupa, groupb, False, False).items():
+                self.__contacts.extend(Contact(kind, sprite, other) for other in hits)
+
+        self.last_time = time.perf_counter() - start
+        self.total_time += self.last_time
+        self.ticks += 1
+        return self.__contacts
+
+    def refresh(self, kind: str) -> list:
+        """
+        Método que recalcula os contatos de um único par (depois que um sprite foi
+        criado em um dos seus grupos durante o tick), substituindo os anteriores.
+
+        Parameters
+        ----------
+        kind : str
+            Tipo do par de grupos.
+
+        Returns
+        -------
+        list
+            Lista de contatos do tipo.
+        """
+
+        start = time.perf_counter()
+
+        groupa, groupb = self.__kinds[kind]
+        self.__spatial_hash.forget(groupb)
+        self.__contacts = [contact for contact in self.__contacts if contact.kind != kind]
+        for sprite, hits in self.__spatial_hash.groupcollide(groupa, groupb, False, False).items():
+            self.__contacts.extend(Contact(kind, sprite, other) for other in hits)
+
+        elapsed = time.perf_counter() - start
+        self.last_time += elapsed
+        self.total_time += elapsed
+        return self.contacts(kind)
+
+    def contacts(self, kind: str) -> list:
+        """
+        Método que devolve os contatos de um tipo cujos sprites ainda não foram
+        destruídos pelas regras já aplicadas no tick.
+
+        Parameters
+        ----------
+        kind : str
+            Tipo do par de grupos.
+
+        Returns
+        -------
+        list
+            Lista de contatos do tipo.
+        """
+
+        return [contact for contact in self.__contacts if contact.kind == kind and contact.a.alive() and contact.b.alive()]
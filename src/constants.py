@@ -19,6 +19,8 @@ GRAY = (128, 128, 128) # cinza
 
 # Fontes
 FONT = join("src","assets","fonts","space_invaders.ttf")
+# Caracteres rasterizados previamente no atlas de cada fonte (os demais entram sob demanda)
+CHARSET = "".join(chr(code) for code in range(32, 127))
 
 # Caminhos (Paths): Imagens
 # TELA DE FUNDO
@@ -59,8 +61,25 @@ EXTERMINATE_SOUND = join("src","assets","sound_effect","exterminate_sound.mp3")
 ITEM_SOUND = join("src","assets","sound_effect","take_item_sound.mp3")
 BOSS_SOUND = join("src","assets","sound_effect","sound_boss_appear.mp3")
 
-# Frames por Segundo
-FPS = 20
+# Canais de som (pool gerenciado pelo banco de sons)
+SOUND_CHANNELS = 16
+# Limites por efeito: (máximo de vozes simultâneas, intervalo mínimo entre disparos em ms do tempo da simulação, prioridade)
+# efeitos com prioridade podem tomar o canal mais antigo quando o pool estiver cheio
+SOUND_LIMITS = {SHOOT_SOUND: (4, 60, False), EXPLOSION_SOUND: (4, 30, False), ITEM_SOUND: (1, 0, True),
+                BOSS_SOUND: (1, 0, True), EXTERMINATE_SOUND: (1, 0, True), GAMEOVER_SOUND: (1, 0, True)}
+
+# Frames por Segundo (limite da renderização)
+FPS = 60
+# Ticks por Segundo da simulação (as velocidades dos sprites são medidas por tick)
+TICK_RATE = 20
+# Tempo máximo (s) de um quadro considerado pela simulação (evita rajadas de ticks após travamentos)
+MAX_FRAME_TIME = 0.25
+
+# Modo de retângulos sujos: atualiza apenas as regiões alteradas da tela (quando possível)
+DIRTY_RECTS = True
+
+# Tempo máximo (em ms) que as interfaces de menu esperam por um evento antes de verificar o estado
+MENU_IDLE_TIMEOUT = 1000
 
 # Escalas de tamanho para os Sprites
 SCALE_BACKGROUND = [WIDTH, HEIGHT]
@@ -72,5 +91,42 @@ SCALE_ITEM = [75, 75]
 SCALE_SHOOT_BOSS = [144, 72]
 SCALE_LIFE = [50, 50]
 
+# Pool de tiros: capacidade e política quando todos estão em uso ("grow", "drop" ou "recycle")
+SHOOT_POOL_CAPACITY = 64
+SHOOT_POOL_OVERFLOW = "grow"
+
+# Tamanho (em pixels) das células da grade de colisões
+COLLISION_CELL = 128
+
 # Tipos de Itens
 ITEMS =  [(SCALE_ITEM, ITEM_LIFE, "hearth"), (SCALE_ITEM, ITEM_FIRE, "fire_rate"), (SCALE_ITEM, ITEM_SPEED, "speed")]
+# Ticks de limpeza da tela (obstáculos explodindo) antes da entrada do boss
+BOSS_CLEAR_TICKS = 15
+# Duração (s da simulação) dos itens temporários
+ITEM_DURATION = 15
+# Coletar um item cujo efeito ainda está ativo: "refresh" (reinicia a duração) ou "stack" (soma as durações)
+ITEM_EFFECT_MODE = "refresh"
+
+# Pré-carregamento (na inicialização, em um pool de threads): (caminhos, escala) de cada sequência de imagens
+PRELOAD_IMAGES = [([BACKGROUND_TITLE, BACKGROUND_PAUSE, BACKGROUND_GAMEOVER], SCALE_BACKGROUND), (BACKGROUND_GAME, SCALE_BACKGROUND),
+                  (PLAYER, SCALE_PLAYER), (OBSTACLE, SCALE_OBSTACLE), (BOSS, SCALE_BOSS),
+                  (SHOOT_PLAYER, SCALE_SHOOT), (SHOOT_OBSTACLE, SCALE_SHOOT), (SHOOT_BOSS, SCALE_SHOOT_BOSS),
+                  (ITEM_LIFE, SCALE_ITEM), (ITEM_FIRE, SCALE_ITEM), (ITEM_SPEED, SCALE_ITEM), (ITEM_LIFE, SCALE_LIFE),
+                  (EXPLOSION, SCALE_OBSTACLE), (EXPLOSION, SCALE_BOSS)]
+# Sons decodificados no pré-carregamento: efeitos e músicas (tocadas como sons, em um canal reservado)
+PRELOAD_SOUNDS = list(SOUND_LIMITS) + [MUSIC_TITLE, MUSIC_GAME]
+# Arquivos lidos em fluxo (guardados na memória): fontes
+PRELOAD_FILES = [FONT]
+# Quantidade de threads do pré-carregamento
+PRELOAD_WORKERS = 4
+# Atlas de sprites (gerado por "python src/atlas.py"; se ausente, as imagens são lidas uma a uma)
+ATLAS_IMAGE = join("src","assets","build","sprites_atlas.png")
+ATLAS_INDEX = join("src","assets","build","sprites_atlas.json")
+# Largura máxima (em pixels) do atlas
+ATLAS_MAX_WIDTH = 4096
+# Cache em disco dos pixels já decodificados e escalonados (lidos com mmap nas próximas inicializações)
+PIXEL_CACHE = True
+PIXEL_CACHE_DIR = join("src","assets","build","pixels")
+# Cache em disco do áudio já decodificado (PCM no formato do mixer)
+AUDIO_CACHE = True
+AUDIO_CACHE_DIR = join("src","assets","build","audio")
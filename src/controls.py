@@ -0,0 +1,388 @@
+"""
+Módulo que contém as fontes de entrada (controles) do jogo: o teclado, um
+piloto automático, usado quando não há ninguém jogando (modo headless), e a
+gravação e reprodução das teclas de uma partida, tick a tick.
+"""
+
+# Importando as bibliotecas
+import struct
+from abc import ABC, abstractmethod
+
+import pygame as pg
+from pygame.locals import *
+
+import exception_game as eg
+
+
+# Teclas usadas pelo jogo: movimento (W, A, S, D), tiro (J) e pause (P)
+GAME_KEYS = (K_w, K_a, K_s, K_d, K_j, K_p)
+
+# Formato das gravações: cabeçalho (identificador, versão, semente da partida, ticks por
+# segundo, largura e altura da tela) seguido de trechos (teclas, quantidade de ticks), em
+# que as teclas são um byte com um bit por tecla de GAME_KEYS
+REPLAY_MAGIC = b"SGRP"
+REPLAY_VERSION = 1
+REPLAY_HEADER = struct.Struct("<4sBIHHH")
+REPLAY_RUN = struct.Struct("<BH")
+
+
+class KeyState:
+    """
+    Classe que guarda quais teclas do jogo estão pressionadas em um tick
+    (indexada como o resultado de pg.key.get_pressed).
+    """
+
+    def __init__(self, pressed=()) -> None:
+        """
+        Método construtor da classe KeyState.
+
+        Parameters
+        ----------
+        pressed : iterable (Opcional)
+            Teclas pressionadas.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.pressed = frozenset(pressed)
+
+    @classmethod
+    def from_mask(cls, mask: int):
+        """
+        Método que monta o estado a partir da máscara de bits das teclas.
+
+        Parameters
+        ----------
+        mask : int
+            Máscara com um bit por tecla de GAME_KEYS.
+
+        Returns
+        -------
+        KeyState
+            Estado das teclas.
+        """
+
+        return cls(key for bit, key in enumerate(GAME_KEYS) if mask & (1 << bit))
+
+    def mask(self) -> int:
+        """
+        Método que converte o estado na máscara de bits das teclas.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        int
+            Máscara com um bit por tecla de GAME_KEYS.
+        """
+
+        return sum(1 << bit for bit, key in enumerate(GAME_KEYS) if key in self.pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        """
+        Método que indica se uma tecla está pressionada.
+
+        Parameters
+        ----------
+        key : int
+            Código da tecla.
+
+        Returns
+        -------
+        bool
+            Verdadeiro se a tecla está pressionada.
+        """
+
+        return key in self.pressed
+
+
+class Controls(ABC):
+    """
+    Classe abstrata das fontes de entrada: a cada tick o jogo lê o estado das
+    teclas uma única vez (poll) e todos os sprites usam esse mesmo estado.
+    """
+
+    def __init__(self) -> None:
+        """
+        Método construtor da classe Controls.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.state = KeyState()
+        self.finished = False # indica que a fonte não tem mais entradas (fim de uma reprodução)
+
+    def poll(self) -> KeyState:
+        """
+        Método que lê o estado das teclas do tick atual.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        KeyState
+            Teclas pressionadas no tick.
+        """
+
+        self.state = self._read()
+        return self.state
+
+    def close(self) -> None:
+        """
+        Método que libera os recursos da fonte de entrada (ao fim da partida).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        pass
+
+    @abstractmethod
+    def _read(self) -> KeyState:
+        """
+        Método abstrato que lê as teclas pressionadas na fonte de entrada.
+        """
+
+        pass
+
+
+class KeyboardControls(Controls):
+    """
+    Classe que lê as teclas do teclado.
+    """
+
+    def _read(self) -> KeyState:
+        """
+        Método que lê as teclas do jogo pressionadas no teclado.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        KeyState
+            Teclas pressionadas no tick.
+        """
+
+        keys = pg.key.get_pressed()
+        return KeyState(key for key in GAME_KEYS if keys[key])
+
+
+class AutoPilot(Controls):
+    """
+    Classe que joga sozinha: atira sempre e acompanha, na vertical, o primeiro
+    inimigo na tela.
+    """
+
+    def __init__(self, player_group: pg.sprite.GroupSingle, target_groups: tuple) -> None:
+        """
+        Método construtor da classe AutoPilot.
+
+        Parameters
+        ----------
+        player_group : pg.sprite.GroupSingle
+            Grupo do player.
+        target_groups : tuple
+            Grupos dos inimigos acompanhados (na ordem de preferência).
+
+        Returns
+        -------
+        None.
+        """
+
+        super().__init__()
+        self.__player_group = player_group
+        self.__target_groups = target_groups
+
+    def _read(self) -> KeyState:
+        """
+        Método que decide as teclas pressionadas no tick.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        KeyState
+            Teclas pressionadas no tick.
+        """
+
+        pressed = [K_j]
+        player = self.__player_group.sprite
+        targets = [sprite for group in self.__target_groups for sprite in group.sprites()]
+        if player is not None and targets:
+            target_y = targets[0].rect.centery
+            if target_y < player.rect.centery - 20:
+                pressed.append(K_w)
+            elif target_y > player.rect.centery + 20:
+                pressed.append(K_s)
+        return KeyState(pressed)
+
+
+class Recorder(Controls):
+    """
+    Classe que repassa as teclas de outra fonte de entrada e as grava em um
+    arquivo compacto (trechos de ticks com as mesmas teclas).
+    """
+
+    def __init__(self, source: Controls, path: str, seed: int, tick_rate: int, size: tuple) -> None:
+        """
+        Método construtor da classe Recorder.
+
+        Parameters
+        ----------
+        source : Controls
+            Fonte de entrada gravada.
+        path : str
+            Caminho do arquivo da gravação.
+        seed : int
+            Semente da sequência de números aleatórios da partida.
+        tick_rate : int
+            Ticks da simulação por segundo.
+        size : tuple
+            Largura e altura da tela.
+
+        Returns
+        -------
+        None.
+        """
+
+        super().__init__()
+        self.__source = source
+        self.__file = open(path, "wb")
+        self.__file.write(REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, seed, tick_rate, *size))
+        self.__mask = 0
+        self.__run = 0 # ticks seguidos com as mesmas teclas
+
+    def _read(self) -> KeyState:
+        """
+        Método que lê as teclas da fonte gravada e as registra.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        KeyState
+            Teclas pressionadas no tick.
+        """
+
+        state = self.__source.poll()
+        mask = state.mask()
+        if mask == self.__mask and self.__run < 0xFFFF:
+            self.__run += 1
+        else:
+            self.__write_run()
+            self.__mask, self.__run = mask, 1
+        return state
+
+    def __write_run(self) -> None:
+        """
+        Método que grava o trecho atual no arquivo.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        if self.__run:
+            self.__file.write(REPLAY_RUN.pack(self.__mask, self.__run))
+
+    def close(self) -> None:
+        """
+        Método que grava o último trecho e fecha o arquivo.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        if not self.__file.closed:
+            self.__write_run()
+            self.__run = 0
+            self.__file.close()
+
+
+class Replayer(Controls):
+    """
+    Classe que reproduz, tick a tick, as teclas de uma gravação.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Método construtor da classe Replayer.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo da gravação.
+
+        Returns
+        -------
+        None.
+        """
+
+        super().__init__()
+        with open(path, "rb") as file:
+            data = file.read()
+
+        try:
+            magic, version, self.seed, self.tick_rate, width, height = REPLAY_HEADER.unpack_from(data)
+        except struct.error as e:
+            raise eg.ReplayError(f"Detalhes do erro: {e}")
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise eg.ReplayError(f"Arquivo de gravação inválido: {path}")
+        if (len(data) - REPLAY_HEADER.size) % REPLAY_RUN.size:
+            raise eg.ReplayError(f"Gravação incompleta: {path}")
+        self.size = (width, height)
+
+        self.__runs = list(REPLAY_RUN.iter_unpack(data[REPLAY_HEADER.size:]))
+        self.ticks = sum(run for _, run in self.__runs) # duração da gravação, em ticks
+        self.__index = 0
+        self.__remaining = self.__runs[0][1] if self.__runs else 0
+        self.finished = not self.__runs
+
+    def _read(self) -> KeyState:
+        """
+        Método que devolve as teclas gravadas para o tick atual.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        KeyState
+            Teclas pressionadas no tick (nenhuma após o fim da gravação).
+        """
+
+        if self.finished:
+            return KeyState()
+
+        mask = self.__runs[self.__index][0]
+        self.__remaining -= 1
+        if self.__remaining == 0:
+            self.__index += 1
+            if self.__index < len(self.__runs):
+                self.__remaining = self.__runs[self.__index][1]
+            else:
+                self.finished = True # o último tick gravado foi reproduzido
+        return KeyState.from_mask(mask)
@@ -48,6 +48,29 @@ class SoundLoadError(Exception):
         super().__init__(self.message)
 
 
+class ImageLoadError(Exception):
+    """
+    Classe que detecta se houve erro ao carregar imagem.
+    """
+
+    def __init__(self, message="Erro ao carregar imagem.") -> None:
+        """
+        Método construtor da classe ImageLoadError.
+
+        Parameters
+        ----------
+        message: str (Opcional)
+            Mensagem de erro.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.message = message
+        super().__init__(self.message)
+
+
 class SpriteGroupError(Exception):
     """
     Classe que detecta se houve erro ao criar grupos de sprites.
@@ -161,4 +184,26 @@ class UpdateScreenError(Exception):
         
         self.message = message
         super().__init__(self.message)
-    
\ No newline at end of file
+    
+
+class ReplayError(Exception):
+    """
+    Classe que detecta se houve erro na leitura de uma gravação de partida.
+    """
+
+    def __init__(self, message="Erro na leitura da gravação da partida.") -> None:
+        """
+        Método construtor da classe ReplayError.
+
+        Parameters
+        ----------
+        message: str (Opcional)
+            Mensagem de erro.
+
+        Returns
+        -------
+        None.
+        """
+        
+        self.message = message
+        super().__init__(self.message)
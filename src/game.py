@@ -4,7 +4,7 @@ criação de sprites e o funcionamento do gameloop.
 """
 
 # Importando as bibliotecas
-import time
+import os
 import random
 
 import pygame as pg
@@ -13,6 +13,11 @@ from pygame.locals import *
 import constants as cst
 import interface as intf
 import sprites as sp
+import resources as rs
+import collision as cl
+import rendering as rd
+import timing as tm
+import controls as ctl
 import exception_game as eg
 
 
@@ -21,36 +26,87 @@ class SpacialGame:
     Classe principal do Jogo.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, fast_forward=False, headless=False, max_ticks=None, seed=None, record=None, replay=None) -> None:
         """
         Método construtor da classe SpacialGame.
         
         Parameters
         ----------
+        fast_forward : bool (Opcional)
+            Se verdadeiro, a simulação roda tão rápido quanto possível, sem esperar pelo tempo real.
+        headless : bool (Opcional)
+            Se verdadeiro, o jogo roda sem janela, sem áudio e sem menus (drivers
+            "dummy" do SDL, nada é desenhado), com o piloto automático jogando as
+            partidas em sequência, tão rápido quanto possível.
+        max_ticks : int (Opcional)
+            Quantidade de ticks da simulação após a qual o jogo termina.
+        seed : int (Opcional)
+            Semente do gerador de números aleatórios do jogo (de onde saem as sementes de cada partida).
+        record : str (Opcional)
+            Diretório onde as teclas de cada partida são gravadas, tick a tick.
+        replay : str (Opcional)
+            Arquivo de uma partida gravada, reproduzida no lugar dos controles (o jogo termina com ela).
         
         Returns
         -------
         None.
         """
 
-        # Inicializando o Pygame
-        pg.init()
-        pg.mixer.init()
-        pg.mixer.set_num_channels(100) # número de canais de som
+        self.__headless = headless
+        self.__max_ticks = max_ticks
+        self.__ticks_run = 0 # ticks simulados desde a abertura do jogo (todas as partidas)
+        self.summary = {"matches": 0, "ticks": 0, "scores": []} # resumo da execução
+
+        # Gerador de números aleatórios do jogo: toda a aleatoriedade de uma partida vem de
+        # uma semente própria, sorteada aqui (ou lida da gravação reproduzida)
+        self.__rng = random.Random(seed)
+        self.__record = record
+        self.__replayer = ctl.Replayer(replay) if replay is not None else None
+        if self.__replayer is not None and (self.__replayer.tick_rate != cst.TICK_RATE or self.__replayer.size != (cst.WIDTH, cst.HEIGHT)):
+            raise eg.ReplayError(f"Gravação feita com outra configuração (ticks por segundo: {self.__replayer.tick_rate}, tela: {self.__replayer.size})")
+        if record is not None:
+            os.makedirs(record, exist_ok=True)
+        self.__matches_started = 0
+        self.__controls = None
+
+        # Inicializando o Pygame (sem janela nem dispositivo de áudio no modo headless)
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            fast_forward = True
+            pg.init()
+            pg.mixer.quit()
+        else:
+            pg.init()
+            pg.mixer.init()
 
         # Criando a Tela de Jogo
-        self.__display = pg.display.set_mode((cst.WIDTH, cst.HEIGHT), pg.FULLSCREEN)
+        self.__display = pg.display.set_mode((cst.WIDTH, cst.HEIGHT), 0 if headless else pg.FULLSCREEN)
         pg.display.set_caption(cst.TITLE)
 
-        # Criando o Relógio de FPS
-        self.__clock = pg.time.Clock()
+        # Criando o relógio da simulação (única fonte de tempo do jogo)
+        self.__sim_clock = tm.SimulationClock(cst.TICK_RATE, cst.MAX_FRAME_TIME, fast_forward)
+        rs.sound_bank.clock = self.__sim_clock # intervalos entre efeitos sonoros medidos em ticks, não em tempo real
 
-        self.__beginning()
+        # Criando o agendador dos efeitos temporários (itens), executado a cada tick
+        self.__scheduler = tm.EffectScheduler(self.__sim_clock)
 
-    def __beginning(self):
+        # Criando o controle de atualização da tela (retângulos sujos, quando habilitado)
+        self.__screen = rd.ScreenUpdater(self.__display, cst.DIRTY_RECTS)
+
+        # Criando o pool de tiros reutilizáveis (compartilhado por player, obstáculos e boss)
+        sp.Shoot.pool = sp.ShootPool(cst.SHOOT_POOL_CAPACITY, cst.SHOOT_POOL_OVERFLOW)
+
+        # Criando a grade de colisões (fase ampla de todos os testes de colisão)
+        self.__spatial_hash = cl.SpatialHash(cst.COLLISION_CELL)
+
+        self.__run()
+
+    def __run(self):
         """
-        Método que constrói a tela de início e encaminha para o início do jogo,
-        criando os sprites, score e o gameloop.
+        Método com o laço principal do jogo: uma máquina de estados (cenas) plana,
+        em que cada cena executa até o fim e devolve o nome da próxima. As cenas são
+        "loading", "title", "credits", "playing", "paused", "gameover" e "reset"; None encerra o jogo.
         
         Parameters
         ----------
@@ -60,32 +116,123 @@ class SpacialGame:
         None.
         """
 
-        # Criando uma pontuação para o jogador
-        self.__score = 0
+        scenes = {"loading": self.__loading,
+                  "title": self.__title,
+                  "credits": self.__credits,
+                  "playing": self.__playing,
+                  "paused": self.__paused,
+                  "gameover": self.__gameover,
+                  "reset": self.__reset}
 
-        # Criando variável que indicará se um item temporário ainda está ativo
-        self.__item_effect_active = None 
+        scene = "loading"
+        try:
+            while scene is not None:
+                scene = scenes[scene]()
+        finally:
+            # Fechando a gravação da partida em andamento (saída do jogo)
+            if self.__controls is not None:
+                self.__controls.close()
+
+    def __loading(self):
+        """
+        Método que pré-carrega todos os recursos do jogo (em um pool de threads),
+        exibindo o progresso, para que nenhum arquivo seja lido durante a partida.
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        str
+            Próxima cena ("title").
+        """
 
-        # Criando o GameLoop para o jogo
-        self.__gameloop = True
+        preloader = rs.Preloader(cst.PRELOAD_IMAGES, cst.PRELOAD_SOUNDS, cst.PRELOAD_FILES, cst.PRELOAD_WORKERS,
+                                 atlas=(cst.ATLAS_IMAGE, cst.ATLAS_INDEX))
+        if self.__headless:
+            preloader.start()
+            while not preloader.finished:
+                preloader.poll()
+        else:
+            loading_screen = intf.Loading(self.__display, preloader)
+            loading_screen.run()
+
+        # Reservando o pool de canais e o canal da música (os sons já foram decodificados)
+        rs.sound_bank.load_all(cst.SOUND_CHANNELS)
+        return "title"
+
+    def __title(self):
+        """
+        Método que constrói a tela de início e, ao apertar PLAY, prepara uma nova
+        partida (score, sprites e música).
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        str
+            Próxima cena ("credits" ou "playing").
+        """
+
+        # Iniciando a Tela de Início do jogo (no modo headless ou na reprodução de uma gravação, a partida começa direto)
+        if not self.__headless and self.__replayer is None:
+            title_screen = intf.Title(self.__display)
+            title_screen.run()
 
-        # Iniciando a Tela de Início do jogo
-        title_screen = intf.Title(self.__display)
-        title_screen.run()
+            # Colocando a interface de Créditos caso esta seja chamada
+            if title_screen.active_credit:
+                return "credits"
 
-        # Colocando a interface de Créditos caso esta seja chamada
-        if title_screen.active_credit:
-            credits = intf.Credits(self.__display)
-            credits.run()
-            if credits.active_reset:
-                self.__beginning()
+        # Criando uma pontuação para o jogador (o texto só é montado de novo quando ela muda)
+        self.__score = 0
+        self.__text_score = intf.Text(self.__display, f"SCORE: {self.__score}", cst.FONT, cst.GREEN, 30, [cst.WIDTH - 150, 50])
+
+        # Criando variável que indicará se um item temporário ainda está ativo
+        self.__item_effect_active = None 
 
         # Delay para a mudança: Tela de Início -> Jogo
-        time.sleep(0.25)
+        if not self.__headless:
+            self.__wait(0.25)
 
         # Iniciando os sprites (e os grupos) e o jogo
         self.__start_sprites()
-        self.__playing()
+
+        # Iniciar a musica do jogo
+        try:
+            rs.sound_bank.play_music(cst.MUSIC_GAME, 0.5)
+        except eg.SoundLoadError as e:
+            raise eg.MusicLoadError(f"Detalhes do erro: {e}")
+
+        # Variáveis úteis para a criação e definição dos parâmetros do boss
+        self.__is_boss = False
+        sp.Obstacle.is_boss = False
+        self.__life_boss = 5
+        self.__count_boss_died = 0 # quanto mais boss mortos, maior a vida e velocidade do próximo boss
+        self.__boss_transition = None # etapa da transição para o boss ("clearing", "intro" ou None)
+        self.__transition_ticks = 0
+        self.__boss = None # boss em entrada na tela
+
+        # Simulação em passo fixo: o tempo real acumulado é consumido em ticks de duração constante
+        self.__sim_clock.reset()
+        return "playing"
+
+    def __credits(self):
+        """
+        Método que constrói a tela de créditos.
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        str
+            Próxima cena ("title").
+        """
+
+        credits = intf.Credits(self.__display)
+        credits.run()
+        return "title"
 
     def __start_sprites(self):
         """
@@ -112,180 +259,350 @@ class SpacialGame:
         except pg.error as e:
             raise eg.SpriteGroupError(f"Detalhes do erro: {e}")
 
+        # Descartando os efeitos temporários da partida anterior
+        self.__scheduler.clear()
+
+        # Semente da partida: a mesma semente e as mesmas teclas, tick a tick, reproduzem a partida
+        self.__matches_started += 1
+        if self.__replayer is not None:
+            match_seed = self.__replayer.seed
+        else:
+            match_seed = self.__rng.getrandbits(32)
+        self.__match_rng = random.Random(match_seed)
+
+        # Fonte de entrada da partida: a gravação reproduzida, o teclado ou, no modo headless, o piloto automático
+        if self.__replayer is not None:
+            self.__controls = self.__replayer
+        elif self.__headless:
+            self.__controls = ctl.AutoPilot(self.__playerGroup, (self.__obstacleGroup, self.__bossGroup))
+        else:
+            self.__controls = ctl.KeyboardControls()
+
+        # Gravando as teclas da partida
+        if self.__record is not None and self.__replayer is None:
+            path = os.path.join(self.__record, f"match_{self.__matches_started:03d}.rpl")
+            self.__controls = ctl.Recorder(self.__controls, path, match_seed, cst.TICK_RATE, (cst.WIDTH, cst.HEIGHT))
+
         # Criando o Background e o Player do jogo.
         try:
             sp.Background(self.__display, cst.SCALE_BACKGROUND, cst.BACKGROUND_GAME, self.__objectGroup)
-            self.__player = sp.Player(self.__display, cst.SCALE_PLAYER, cst.PLAYER, (self.__objectGroup, self.__playerGroup), group_shoot=self.__shootPlayerGroup)
+            self.__player = sp.Player(self.__display, cst.SCALE_PLAYER, cst.PLAYER, (self.__objectGroup, self.__playerGroup), group_shoot=self.__shootPlayerGroup, scheduler=self.__scheduler, controls=self.__controls)
         except ValueError as ve:
             raise eg.SpriteGroupError(f"Detalhes do erro: {ve}")
 
+        # Pares de grupos testados a cada tick (cada par é calculado uma única vez)
+        self.__collisions = cl.CollisionResolver(self.__spatial_hash, [
+            ("player_obstacle", self.__playerGroup, self.__obstacleGroup),
+            ("player_shoot_obstacle", self.__playerGroup, self.__shootObstacleGroup),
+            ("player_boss", self.__playerGroup, self.__bossGroup),
+            ("player_shoot_boss", self.__playerGroup, self.__shootBossGroup),
+            ("shoot_obstacle", self.__shootPlayerGroup, self.__obstacleGroup),
+            ("shoot_shoot_obstacle", self.__shootPlayerGroup, self.__shootObstacleGroup),
+            ("shoot_shoot_boss", self.__shootPlayerGroup, self.__shootBossGroup),
+            ("player_item", self.__playerGroup, self.__itemGroup),
+            ("shoot_boss", self.__shootPlayerGroup, self.__bossGroup),
+        ])
+
     def __playing(self):
         """
-        Método onde se constrói a jogabilidade do jogo.
+        Método onde se constrói a jogabilidade do jogo (até a pausa, o gameover ou a saída).
         
         Parameters
         ----------
         
         Returns
         -------
-        None.
+        str
+            Próxima cena ("paused", "gameover" ou None para sair do jogo).
         """
 
-        # Iniciar a musica do jogo
+        self.__next_scene = "playing"
         try:
-            pg.mixer.music.load(cst.MUSIC_GAME)
-            pg.mixer.music.set_volume(0.5)
-            pg.mixer.music.play(-1)
-        except pg.error as e:
-            raise eg.MusicLoadError(f"Detalhes do erro: {e}")
-
-        # Variáveis úteis para a criação e definição dos parâmetros do boss
-        is_boss = False
-        life_boss = 5
-        count_boss_died = 0 # quanto mais boss mortos, maior a vida e velocidade do próximo boss
-
-        try:
-            while self.__gameloop:
-                self.__clock.tick(cst.FPS)
-                self.__keys = pg.key.get_pressed()
+            while self.__next_scene == "playing":
+                ticks = self.__sim_clock.frame(cst.FPS)
 
                 # Evento: sair do jogo
                 for event in pg.event.get():
                     if event.type == QUIT:
-                        self.__gameloop = False
+                        self.__next_scene = None
 
-                # Geração de obstáculos (caso não haja nenhum na tela e não haja boss)
-                if len(self.__obstacleGroup.sprites()) == 0 and not is_boss:
-                    try:
-                        sp.Obstacle(self.__display, cst.SCALE_OBSTACLE, cst.OBSTACLE, self.__score, (self.__objectGroup, self.__obstacleGroup), group_shoot=self.__shootObstacleGroup)
-                    except ValueError as ve:
-                        raise eg.SpriteInstanceError(f"Detalhes do erro: {ve}")
+                # Ticks da simulação que couberem no tempo acumulado
+                for _ in range(ticks):
+                    if self.__next_scene != "playing" or self.__player.lifes == 0 or self.__controls.finished:
+                        break
+                    self.__tick()
 
-                # Colisão de (player com obstáculo) ou (player com tiro do obstáculo) ou (player com tiro do boss)
-                try:
-                    if pg.sprite.groupcollide(self.__playerGroup, self.__obstacleGroup, False, True, pg.sprite.collide_mask) or pg.sprite.groupcollide(self.__playerGroup, self.__shootObstacleGroup, False, True, pg.sprite.collide_mask) or pg.sprite.groupcollide(self.__playerGroup, self.__bossGroup, False, False, pg.sprite.collide_mask) or pg.sprite.groupcollide(self.__playerGroup, self.__shootBossGroup, False, True, pg.sprite.collide_mask):
-                        self.__player.lifes -= 1
-                        self.__player.damaged = True
-                except pg.error as e:
-                    raise eg.CollisionError(f"Detalhes do erro: {e}")
+                # Fim da gravação reproduzida
+                if self.__controls.finished:
+                    self.__next_scene = None
 
-                # Colisão de tiro do player com obstáculo
-                try:
-                    if pg.sprite.groupcollide(self.__shootPlayerGroup, self.__obstacleGroup, False, False, pg.sprite.collide_mask):
-                        collisions = pg.sprite.groupcollide(self.__shootPlayerGroup, self.__obstacleGroup, True, False, pg.sprite.collide_mask)
-                        for shoot in collisions:
-                            obstacle_list = collisions[shoot]
-                            for obstacle in obstacle_list:
-                                obstacle.exploded = True
-                        self.__score += 1
-                except pg.error as e:
-                    raise eg.CollisionError(f"Detalhes do erro: {e}")
-                
-                # Colisão de tiros
-                try:
-                    pg.sprite.groupcollide(self.__shootPlayerGroup, self.__shootObstacleGroup, True, True, pg.sprite.collide_mask) # player e obstáculo
-                    pg.sprite.groupcollide(self.__shootPlayerGroup, self.__shootBossGroup, True, False, pg.sprite.collide_mask) # player e boss
-                except pg.error as e:
-                    raise eg.CollisionError(f"Detalhes do erro: {e}")
-                
-                # Condição para o surgimento de itens (de 15 em 15 pontos)
-                if self.__score != 0 and self.__score % 15 == 0 and len(self.__itemGroup) == 0 and not is_boss:
-                    item = random.choice(cst.ITEMS)
-                    try:
-                        sp.Items(self.__display, item[0], item[1], item[2], (self.__objectGroup, self.__itemGroup), player=self.__player)
-                    except ValueError as ve:
-                        raise eg.SpriteInstanceError(f"Detalhes do erro: {ve}")
-
-                # Colisão de player com item: o player adquire as propriedades do item
-                try:
-                    if pg.sprite.groupcollide(self.__playerGroup, self.__itemGroup, False, False, pg.sprite.collide_mask):
-                        collisions = pg.sprite.groupcollide(self.__playerGroup, self.__itemGroup, False, True, pg.sprite.collide_mask)
-                        try:
-                            take_item_sound = pg.mixer.Sound(cst.ITEM_SOUND)
-                            take_item_sound.play()
-                        except pg.error as e:
-                            raise eg.SoundLoadError(f"Detalhes do erro: {e}")
-                        item = list(collisions.values())[0][0]
-                        self.__item_effect_active = item
-                        item.apply_effect()
-                except pg.error as e:
-                    raise eg.CollisionError(f"Detalhes do erro: {e}")
-
-                # Tela de pause
-                if self.__keys[K_p]:
-                    pause_screen = intf.Pause(self.__display)
-                    pause_screen.run()
-                    if pause_screen.active_reset:
-                        self.__reset()
-
-                # Condição para o surgimento do boss (de 20 em 20 pontos)
-                if self.__score != 0 and self.__score % 20 == 0 and len(self.__bossGroup.sprites()) == 0:
-                    is_boss = True
-                    for _ in range(15):
-                        for og in self.__obstacleGroup.sprites():
-                            og.exploded = True
-                        self.__kill_sprites(self.__shootObstacleGroup)
-                        self.__kill_sprites(self.__shootPlayerGroup)
-                        self.__objectGroup.draw(self.__display)
-                        self.__objectGroup.update()
-                        try:
-                            pg.display.update()
-                        except pg.error as e:
-                            raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
-                    
-                    try:
-                        boss = sp.Boss(self.__display, cst.SCALE_BOSS, cst.BOSS, self.__score, life_boss + count_boss_died * 5, (self.__objectGroup, self.__bossGroup), group_shoot=self.__shootBossGroup)
-                    except ValueError as ve:
-                        raise eg.SpriteInstanceError(f"Detalhes do erro: {ve}")
-                    while boss.speedx > 0:
-                        self.__clock.tick(cst.FPS)
-                        self.__bossGroup.draw(self.__display)
-                        self.__bossGroup.update()
-                        try:
-                            pg.display.update()
-                        except pg.error as e:
-                            raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
-                        continue
-
-                # Colisão de tiro do player com o boss
-                try:
-                    if pg.sprite.groupcollide(self.__shootPlayerGroup, self.__bossGroup, True, False, pg.sprite.collide_mask):
-                        boss.lifes -= 1
-                        boss.damaged = True
-                        if boss.lifes == 0:
-                            self.__score += 1
-                            is_boss = False
-                            count_boss_died += 1
-                except pg.error as e:
-                    raise eg.CollisionError(f"Detalhes do erro: {e}")
-
-                # Atualizando a verificação de existência de boss para a criação de novos obstáculos
-                sp.Obstacle.is_boss = is_boss
-
-                # Desenhar os objetos na tela
-                self.__objectGroup.draw(self.__display)
-                self.__objectGroup.update()
-                if self.__item_effect_active and (not self.__player.shooting_enabled or not self.__player.increase_speed_enabled):
-                    # Exibir a imagem do item no topo da tela
-                    self.__display.blit(self.__item_effect_active.image, (cst.WIDTH // 2 - self.__item_effect_active.rect.width // 2, 10))
-                text_score = intf.Text(self.__display, f"SCORE: {self.__score}", cst.FONT, cst.GREEN, 30, [cst.WIDTH - 150, 50])
-                text_score.draw()
-                try:
-                    pg.display.update()
-                except pg.error as e:
-                    raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
+                # Renderização, interpolando as posições entre os dois últimos ticks (nada é desenhado no modo headless)
+                if not self.__headless:
+                    self.__render(self.__sim_clock.alpha)
+
+                # Limite de ticks da execução
+                if self.__max_ticks is not None and self.__ticks_run >= self.__max_ticks:
+                    self.__next_scene = None
 
                 # Evento: você perdeu
                 if self.__player.lifes == 0:
-                    self.__gameover()
-                try:
-                    pg.display.update()
-                except pg.error as e:
-                    raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
+                    self.__next_scene = "gameover"
         except Exception as e:
             raise eg.GameLoopError(f"Detalhes do erro: {e}")
 
-    
+        return self.__next_scene
+
+    def __paused(self):
+        """
+        Método que constrói a tela de pause, com o tempo da simulação congelado.
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        str
+            Próxima cena ("playing" ou "reset").
+        """
+
+        # A pausa não faz parte da simulação: na reprodução de uma gravação ela é ignorada
+        if self.__replayer is not None:
+            return "playing"
+
+        pause_screen = intf.Pause(self.__display)
+        self.__sim_clock.pause()
+        pause_screen.run()
+        self.__sim_clock.resume() # o tempo parado na pausa não entra na simulação
+        if pause_screen.active_reset:
+            return "reset"
+        return "playing"
+
+    def __tick(self):
+        """
+        Método que avança a simulação do jogo em um tick (geração de sprites,
+        colisões, regras e movimentos), sem desenhar nada na tela.
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        None.
+        """
+
+        self.__sim_clock.step()
+        self.__ticks_run += 1
+        self.summary["ticks"] = self.__ticks_run
+        self.__scheduler.update() # expira os efeitos vencidos neste tick
+        self.__keys = self.__controls.poll() # teclas do tick (as mesmas para todos os sprites)
+
+        # Durante a transição para o boss, apenas ela é simulada
+        if self.__boss_transition is not None:
+            self.__tick_boss_transition()
+            return
+
+        # Geração de obstáculos (caso não haja nenhum na tela e não haja boss)
+        if len(self.__obstacleGroup.sprites()) == 0 and not self.__is_boss:
+            try:
+                sp.Obstacle(self.__display, cst.SCALE_OBSTACLE, cst.OBSTACLE, self.__score, (self.__objectGroup, self.__obstacleGroup), group_shoot=self.__shootObstacleGroup, rng=self.__match_rng)
+            except ValueError as ve:
+                raise eg.SpriteInstanceError(f"Detalhes do erro: {ve}")
+
+        # Calculando os contatos de todos os pares de grupos (uma única vez por tick)
+        try:
+            self.__collisions.resolve()
+        except pg.error as e:
+            raise eg.CollisionError(f"Detalhes do erro: {e}")
+
+        # Colisão de (player com obstáculo) ou (player com tiro do obstáculo) ou (player com boss) ou (player com tiro do boss)
+        for kind in ("player_obstacle", "player_shoot_obstacle", "player_boss", "player_shoot_boss"):
+            contacts = self.__collisions.contacts(kind)
+            if contacts:
+                if kind != "player_boss": # o boss não é destruído ao colidir com o player
+                    for contact in contacts:
+                        contact.b.kill()
+                self.__player.lifes -= 1
+                self.__player.damaged = True
+                break
+
+        # Colisão de tiro do player com obstáculo
+        contacts = self.__collisions.contacts("shoot_obstacle")
+        if contacts:
+            for contact in contacts:
+                contact.a.kill()
+                contact.b.exploded = True
+            self.__score += 1
+
+        # Colisão de tiros: player e obstáculo (ambos são destruídos)
+        hit_shoots = []
+        for contact in self.__collisions.contacts("shoot_shoot_obstacle"):
+            if contact.b.alive(): # o tiro do obstáculo pode já ter sido destruído por outro tiro
+                contact.b.kill()
+                hit_shoots.append(contact.a)
+        for shoot in hit_shoots:
+            shoot.kill()
+        # Colisão de tiros: player e boss (apenas o tiro do player é destruído)
+        for contact in self.__collisions.contacts("shoot_shoot_boss"):
+            contact.a.kill()
+        
+        # Condição para o surgimento de itens (de 15 em 15 pontos)
+        if self.__score != 0 and self.__score % 15 == 0 and len(self.__itemGroup) == 0 and not self.__is_boss:
+            item = self.__match_rng.choice(cst.ITEMS)
+            try:
+                sp.Items(self.__display, item[0], item[1], item[2], (self.__objectGroup, self.__itemGroup), player=self.__player, rng=self.__match_rng)
+            except ValueError as ve:
+                raise eg.SpriteInstanceError(f"Detalhes do erro: {ve}")
+            # o item criado neste tick já pode ser coletado neste tick
+            try:
+                self.__collisions.refresh("player_item")
+            except pg.error as e:
+                raise eg.CollisionError(f"Detalhes do erro: {e}")
+
+        # Colisão de player com item: o player adquire as propriedades do item
+        contacts = self.__collisions.contacts("player_item")
+        if contacts:
+            for contact in contacts:
+                contact.b.kill()
+            rs.sound_bank.play(cst.ITEM_SOUND)
+            item = contacts[0].b
+            self.__item_effect_active = item
+            item.apply_effect()
+
+        # Tela de pause (aberta ao fim do tick)
+        if self.__keys[K_p]:
+            self.__next_scene = "paused"
+
+        # Condição para o surgimento do boss (de 20 em 20 pontos): começa a transição, nos próximos ticks
+        if self.__score != 0 and self.__score % 20 == 0 and len(self.__bossGroup.sprites()) == 0:
+            self.__is_boss = True
+            self.__boss_transition = "clearing"
+            self.__transition_ticks = cst.BOSS_CLEAR_TICKS
+
+        # Colisão de tiro do player com o boss
+        contacts = self.__collisions.contacts("shoot_boss")
+        if contacts:
+            for contact in contacts:
+                contact.a.kill()
+            boss = contacts[0].b
+            boss.lifes -= 1
+            boss.damaged = True
+            if boss.lifes == 0:
+                self.__score += 1
+                self.__is_boss = False
+                self.__count_boss_died += 1
+
+        # Atualizando a verificação de existência de boss para a criação de novos obstáculos
+        sp.Obstacle.is_boss = self.__is_boss
+
+        # Atualizar o estado dos objetos (as posições atuais viram as anteriores, usadas na interpolação)
+        for sprite in self.__objectGroup.sprites():
+            sprite.save_position()
+        self.__objectGroup.update()
+
+    def __tick_boss_transition(self):
+        """
+        Método que avança em um tick a transição para o boss: primeiro a limpeza da
+        tela ("clearing", obstáculos explodem e tiros somem), depois a entrada do
+        boss ("intro", apenas o boss se movimenta). O laço principal continua
+        tratando os eventos e desenhando os quadros normalmente.
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        None.
+        """
+
+        if self.__boss_transition == "clearing":
+            for og in self.__obstacleGroup.sprites():
+                og.exploded = True
+            self.__kill_sprites(self.__shootObstacleGroup)
+            self.__kill_sprites(self.__shootPlayerGroup)
+            for sprite in self.__objectGroup.sprites():
+                sprite.save_position()
+            self.__objectGroup.update()
+
+            self.__transition_ticks -= 1
+            if self.__transition_ticks == 0:
+                try:
+                    self.__boss = sp.Boss(self.__display, cst.SCALE_BOSS, cst.BOSS, self.__score, self.__life_boss + self.__count_boss_died * 5, (self.__objectGroup, self.__bossGroup), group_shoot=self.__shootBossGroup, clock=self.__sim_clock, rng=self.__match_rng)
+                except ValueError as ve:
+                    raise eg.SpriteInstanceError(f"Detalhes do erro: {ve}")
+                self.__boss_transition = "intro"
+
+        elif self.__boss_transition == "intro":
+            for sprite in self.__objectGroup.sprites():
+                sprite.save_position()
+            self.__bossGroup.update()
+            if self.__boss.speedx == 0:
+                self.__boss_transition = None
+                self.__boss = None
+
+        # Atualizando a verificação de existência de boss para a criação de novos obstáculos
+        sp.Obstacle.is_boss = self.__is_boss
+
+    def __render(self, alpha: float):
+        """
+        Método que desenha o quadro atual (uma única vez cada sprite) e atualiza a tela.
+        
+        Parameters
+        ----------
+        alpha : float
+            Fração (entre 0 e 1) do tempo decorrido entre o último tick e o próximo.
+        
+        Returns
+        -------
+        None.
+        """
+
+        self.__draw_sprites(self.__objectGroup, alpha)
+        if self.__item_effect_active and (not self.__player.shooting_enabled or not self.__player.increase_speed_enabled):
+            # Exibir a imagem do item no topo da tela
+            self.__screen.add([self.__display.blit(self.__item_effect_active.image, (cst.WIDTH // 2 - self.__item_effect_active.rect.width // 2, 10))])
+        self.__text_score.text = f"SCORE: {self.__score}"
+        self.__screen.add([self.__text_score.draw()])
+        self.__screen.flush() # uma única atualização de tela por quadro
+
+    def __wait(self, seconds: float):
+        """
+        Método que espera um intervalo de tempo da simulação (sem simular nada),
+        mantendo a janela responsiva.
+        
+        Parameters
+        ----------
+        seconds : float
+            Duração da espera, em segundos da simulação.
+        
+        Returns
+        -------
+        None.
+        """
+
+        self.__sim_clock.reset()
+        while self.__sim_clock.now < seconds:
+            for _ in range(self.__sim_clock.frame(cst.FPS)):
+                self.__sim_clock.step()
+            pg.event.pump()
+
+    def __draw_sprites(self, group, alpha=1.0):
+        """
+        Método que desenha na tela, uma única vez, cada sprite visível de um grupo.
+        
+        Parameters
+        ----------
+        group : pg.sprite.Group
+            Grupo de sprites que será desenhado.
+        alpha : float (Opcional)
+            Fração do tempo entre ticks usada na interpolação das posições.
+        
+        Returns
+        -------
+        None.
+        """
+
+        for sprite in group.sprites():
+            self.__screen.add(sprite.draw(alpha))
 
     def __kill_sprites(self, group):
         """
@@ -304,15 +621,16 @@ class SpacialGame:
 
     def __reset(self):
         """
-        Método onde se destroem todos os objetos (sprites) do jogo e, logo em
-        seguida, efetua o reinício do mesmo.
+        Método onde se destroem todos os objetos (sprites) da partida, liberando
+        os recursos dela antes do retorno à tela de início.
         
         Parameters
         ----------
         
         Returns
         -------
-        None.
+        str
+            Próxima cena ("title" ou None, ao fim da reprodução de uma gravação).
         """
 
         # Removendo todos os sprites
@@ -320,11 +638,24 @@ class SpacialGame:
 
         # Redefinir o estado do efeito dos itens
         self.__item_effect_active = None
+        self.__scheduler.clear()
 
-        # Reiniciando o jogo (retornando ao beginning())
-        self.__beginning()
+        # Encerrando a gravação da partida
+        self.__controls.close()
 
-    def __gameover(self) -> None:
+        # Liberando os grupos, o player e as colisões da partida
+        self.__spatial_hash.clear()
+        self.__collisions = None
+        self.__player = self.__boss = self.__controls = None
+        self.__objectGroup = self.__playerGroup = self.__obstacleGroup = self.__itemGroup = None
+        self.__shootPlayerGroup = self.__shootObstacleGroup = self.__bossGroup = self.__shootBossGroup = None
+
+        # Retornando à tela de início (a reprodução de uma gravação termina com a partida)
+        if self.__replayer is not None:
+            return None
+        return "title"
+
+    def __gameover(self):
         """
         Método que atualiza um texto de gameover na tela e encaminha
         para a interface de reset.
@@ -334,33 +665,30 @@ class SpacialGame:
         
         Returns
         -------
-        None.
+        str
+            Próxima cena ("reset").
         """
 
+        self.summary["matches"] += 1
+        self.summary["scores"].append(self.__score)
+        if self.__headless:
+            return "reset"
+
         # Texto: gameover
-        pg.mixer.music.stop()
+        rs.sound_bank.stop_music()
         text_gameover = intf.Text(self.__display, "GAME OVER", cst.FONT, cst.RED, 120, [cst.WIDTH // 2, cst.HEIGHT // 2])
-        text_gameover.draw()
-        try:
-            pg.display.update()
-        except pg.error as e:
-            raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
+        self.__screen.add([text_gameover.draw()])
+        self.__screen.flush()
 
         # Efeitos sonoros para o gameover
-        try:
-            exterminate_sound = pg.mixer.Sound(cst.EXTERMINATE_SOUND)
-            exterminate_sound.play()
-            gameover_sound = pg.mixer.Sound(cst.GAMEOVER_SOUND)
-            gameover_sound.play()
-        except pg.error as e:
-            raise eg.SoundLoadError(f"Detalhes do erro: {e}")
+        rs.sound_bank.play(cst.EXTERMINATE_SOUND)
+        rs.sound_bank.play(cst.GAMEOVER_SOUND)
 
-        time.sleep(3)
-        self.__gameloop = False
+        self.__wait(3)
 
         # Construindo a tela de reset
         reset_screen = intf.Reset(self.__display, self.__score)
         reset_screen.run()
 
         # Encaminhando para o reinício do jogo
-        self.__reset()
+        return "reset"
@@ -10,7 +10,8 @@ import pygame as pg
 from pygame.locals import *
 
 import constants as cst
-import sprites as sp
+import resources as rs
+import rendering as rd
 import exception_game as eg
 
 
@@ -46,7 +47,8 @@ class UIElement(ABC):
 
         self._display = display
         self.text = text
-        self._font = pg.font.Font(font, size)
+        self._font_path = font
+        self._font = rs.text_cache.font(font, size) # fonte compartilhada (o arquivo é lido uma única vez)
         self._color = color
         self._size = size
         self._pos_x = pos[0]
@@ -98,22 +100,29 @@ class Text(UIElement):
         """
 
         super().__init__(display, text, font, color, size, pos)
+        self.__rendered_text = None # texto da última superfície montada
+        self.__surface = None
+        self.__rect = None
 
-    def draw(self) -> None:
+    def draw(self) -> pg.Rect:
         """
-        Método que permite o desenho de textos na tela.
+        Método que permite o desenho de textos na tela. A superfície do texto só
+        é montada novamente quando o conteúdo muda.
         
         Parameters
         ----------
         
         Returns
         -------
-        None.
+        pg.Rect
+            Região da tela ocupada pelo texto.
         """
 
-        text = self._font.render(self.text, True, self._color)
-        text_rect = text.get_rect(center=(self._pos_x, self._pos_y))
-        self._display.blit(text, text_rect)
+        if self.text != self.__rendered_text:
+            self.__rendered_text = self.text
+            self.__surface = rs.text_cache.render(self.text, self._font_path, self._size, self._color)
+            self.__rect = self.__surface.get_rect(center=(self._pos_x, self._pos_y))
+        return self._display.blit(self.__surface, self.__rect)
 
 
 class Button(UIElement):
@@ -153,51 +162,115 @@ class Button(UIElement):
 
         super().__init__(display, text, font, color, size, pos)
 
-        self._text_font = font
         self._width = width
         self._height = height
         self._color_button = cst.WHITE
         self.is_pressed = False
         self._is_selected = is_selected
+        self.__label = Text(display, text, font, color, size, pos) # texto do botão (montado uma única vez)
+        self.rect = None # região da tela ocupada pelo último desenho do botão
+        self.__changed = False # indica se o estado do botão mudou desde o último desenho
+        self.__first_update = True
 
-    def draw(self) -> None:
+    def __hover(self, pos: tuple) -> bool:
         """
-        Método que permite o desenho de butões na tela
+        Método que atualiza a cor de destaque do botão para uma posição do mouse.
         
         Parameters
         ----------
-        
+        pos : tuple
+            Tupla contendo a posição x e y do mouse.
+
         Returns
         -------
-        None.
+        bool
+            Verdadeiro se o mouse está sobre o botão.
         """
 
-        # Coleta as posições do mouse
-        mouse_x, mouse_y = pg.mouse.get_pos()
-
-        # Condição para trocar de cor caso o mouse colida e verificar se houve click
-        if (
+        mouse_x, mouse_y = pos
+        hovered = (
             self._pos_x - self._width // 2 - 2 <= mouse_x <= self._pos_x - self._width // 2 + self._width + 2
         ) and (
             self._pos_y - self._height // 2 - 4 <= mouse_y <= self._pos_y - self._height // 2 + self._height + 2
-        ):
-            self._color_button = cst.BLUE
-            if pg.mouse.get_pressed()[0]:
+        )
+
+        color_button = cst.BLUE if hovered else cst.WHITE
+        if color_button != self._color_button:
+            self._color_button = color_button
+            self.__changed = True
+        return hovered
+
+    def handle_event(self, event: pg.event.Event) -> None:
+        """
+        Método que atualiza o estado do botão (cor de destaque e clique) a partir
+        de um evento do mouse, sem consultar o mouse a cada quadro.
+        
+        Parameters
+        ----------
+        event : pg.event.Event
+            Evento recebido pela interface.
+
+        Returns
+        -------
+        None.
+        """
+
+        if event.type == MOUSEMOTION:
+            self.__hover(event.pos)
+        elif event.type == MOUSEBUTTONDOWN and event.button == 1:
+            # o clique só vale se acontecer com o mouse sobre o botão
+            if self.__hover(event.pos) and not self.is_pressed:
                 self.is_pressed = True
-            else:
+                self.__changed = True
+        elif event.type == MOUSEBUTTONUP and event.button == 1:
+            if self.is_pressed:
                 self.is_pressed = False
-        else:
-            self._color_button = cst.WHITE
+                self.__changed = True
+
+    def update(self) -> bool:
+        """
+        Método que informa se o estado do botão mudou desde a última consulta.
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        bool
+            Verdadeiro se o estado visual ou de clique do botão mudou.
+        """
+
+        if self.__first_update: # posição inicial do mouse (antes de qualquer evento)
+            self.__first_update = False
+            self.__hover(pg.mouse.get_pos())
+
+        changed = self.__changed
+        self.__changed = False
+        return changed
+
+    def draw(self) -> pg.Rect:
+        """
+        Método que permite o desenho de butões na tela
+        
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        pg.Rect
+            Região da tela ocupada pelo botão (com a borda).
+        """
 
         # Desenha a borda do botão
-        pg.draw.rect(self._display, cst.BLACK, (self._pos_x - self._width // 2 - 2, self._pos_y - self._height // 2 - 4, self._width + 4, self._height + 6), 0)
+        border_rect = pg.draw.rect(self._display, cst.BLACK, (self._pos_x - self._width // 2 - 2, self._pos_y - self._height // 2 - 4, self._width + 4, self._height + 6), 0)
 
         # Desenha o botão
         pg.draw.rect(self._display, self._color_button, (self._pos_x - self._width // 2, self._pos_y - self._height // 2 - 2, self._width, self._height), 0)
 
         # Desenha o texto do botão
-        text = Text(self._display, self.text, self._text_font, self._color, self._size, [self._pos_x, self._pos_y])
-        text.draw()
+        self.__label.text = self.text
+        self.rect = border_rect.union(self.__label.draw())
+        return self.rect
 
 
 class Interface(ABC):
@@ -205,6 +278,8 @@ class Interface(ABC):
     Classe abstrata que controla a interface de Tela de início do jogo.
     """
 
+    _static_frames = {} # atríbuto global com as camadas estáticas já compostas de cada interface
+
     def __init__(self, display: pg.Surface) -> None:
         """
         Método constutor da classe Interface.
@@ -225,6 +300,9 @@ class Interface(ABC):
         self._clock = pg.time.Clock()
         self.active_credit = False
         self.active_reset = False
+        self._screen = rd.ScreenUpdater(display, cst.DIRTY_RECTS) # o primeiro quadro da interface é sempre completo
+        self._static_frame = None # background e textos da interface, compostos uma única vez
+        self.__first_frame = True
 
     @abstractmethod
     def run(self) -> None:
@@ -255,11 +333,110 @@ class Interface(ABC):
         None.
         """
 
-        try:
-            background = sp.Background(self._display, cst.SCALE_BACKGROUND, [background_path])
-        except ValueError as ve:
-            raise eg.SpriteInstanceError(f"Detalhes do erro: {ve}")
-        self._display.blit(background.image, (0, 0))
+        self._display.blit(rs.image_cache.load(background_path, cst.SCALE_BACKGROUND), (0, 0))
+
+    def _compose(self, background_path: str, texts: list) -> None:
+        """
+        Método que compõe as camadas estáticas da interface (background e textos)
+        em uma única superfície, reaproveitada enquanto o conteúdo não muda.
+        
+        Parameters
+        ----------
+        background_path : str
+            Caminho do background da interface.
+        texts : list
+            Lista de textos fixos da interface.
+
+        Returns
+        -------
+        None.
+        """
+
+        key = (type(self).__name__, background_path) + tuple(text.text for text in texts)
+        frame = Interface._static_frames.get(key)
+        if frame is None:
+            self._load_background(background_path)
+            for text in texts:
+                text.draw()
+            frame = self._display.copy()
+            Interface._static_frames[key] = frame
+        self._static_frame = frame
+
+    def _draw_buttons(self, buttons: list) -> list:
+        """
+        Método que desenha o quadro da interface: completo na primeira vez e, depois,
+        apenas os botões cujo destaque ou clique mudou.
+        
+        Parameters
+        ----------
+        buttons : list
+            Lista de botões da interface.
+
+        Returns
+        -------
+        list
+            Lista de regiões da tela redesenhadas.
+        """
+
+        rects = []
+        if self.__first_frame:
+            self._display.blit(self._static_frame, (0, 0))
+            self._screen.invalidate()
+        for button in buttons:
+            if button.update() or self.__first_frame:
+                if button.rect is not None:
+                    self._display.blit(self._static_frame, button.rect, button.rect) # apaga o desenho anterior
+                rects.append(button.draw())
+        self.__first_frame = False
+        return rects
+
+    def _wait_events(self, buttons: list) -> None:
+        """
+        Método que bloqueia até a chegada de um evento (ou até o tempo limite),
+        repassando os eventos aos botões. Enquanto nada acontece, a interface
+        não consome CPU.
+        
+        Parameters
+        ----------
+        buttons : list
+            Lista de botões da interface.
+
+        Returns
+        -------
+        None.
+        """
+
+        self._clock.tick(cst.FPS) # limita a taxa de redesenho durante movimentos do mouse
+
+        event = pg.event.wait(cst.MENU_IDLE_TIMEOUT)
+        if event.type == NOEVENT: # tempo limite atingido sem eventos
+            return
+
+        for event in [event] + pg.event.get():
+            if event.type == QUIT:
+                self._quit()
+            elif event.type in (VIDEOEXPOSE, WINDOWEXPOSED, WINDOWRESTORED, WINDOWFOCUSGAINED):
+                self.__first_frame = True # a janela precisa ser redesenhada por completo
+            for button in buttons:
+                button.handle_event(event)
+
+    def _present(self, rects: list) -> None:
+        """
+        Método que envia o quadro para a tela. Como o background e os textos da
+        interface não mudam, só as regiões indicadas (botões) precisam ser atualizadas.
+        
+        Parameters
+        ----------
+        rects : list
+            Lista de regiões da tela que podem ter mudado.
+
+        Returns
+        -------
+        None.
+        """
+
+        self._screen.add(rects)
+        self._screen.flush()
 
     def _quit(self) -> None:
         """
@@ -293,9 +470,9 @@ class Interface(ABC):
 
         if button.is_pressed:
             if button.text == "PLAY": # específico da Tela de Início
-                pg.mixer.music.stop()
+                rs.sound_bank.stop_music()
             elif button.text == "RETURN TO MENU": # específico da Tela de Pause e de Reset
-                pg.mixer.music.stop()
+                rs.sound_bank.stop_music()
                 self.active_reset = True # ativa a variável que permite o resetamento do jogo
             elif button.text == "CREDITS": # específico da Tela de Início
                 self.active_credit = True # ativa a variável que permite a entrada nos créditos
@@ -307,6 +484,72 @@ class Interface(ABC):
             self.waiting_player = False # comum a todas as condições acima
 
 
+class Loading(Interface):
+    """
+    Classe que controla a interface de carregamento dos recursos do jogo.
+    """
+
+    def __init__(self, display: pg.Surface, preloader: rs.Preloader) -> None:
+        """
+        Método constutor da classe Loading.
+
+        Parameters
+        ----------
+        display : pg.Surface
+            Tela onde acontece o jogo.
+        preloader : rs.Preloader
+            Pré-carregamento dos recursos, cujo progresso é exibido.
+        
+        Returns
+        -------
+        None.
+        """
+
+        super().__init__(display)
+        self.__preloader = preloader
+
+    def run(self) -> None:
+        """
+        Método que atualiza a interface de carregamento (background da Tela de Início
+        e barra de progresso) até que todos os recursos tenham sido carregados.
+
+        Parameters
+        ----------
+        
+        Returns
+        -------
+        None.
+        """
+
+        text_loading = Text(self._display, "LOADING", cst.FONT, cst.GREEN, 30, [self._width // 2, self._height - 200])
+        bar = pg.Rect(0, 0, 400, 20)
+        bar.center = (self._width // 2, self._height - 150)
+
+        self.__preloader.start()
+        while self.waiting_player:
+            progress = self.__preloader.poll()
+
+            # background da Tela de Início, assim que ele for decodificado
+            if rs.image_cache.contains(cst.BACKGROUND_TITLE, cst.SCALE_BACKGROUND):
+                self._load_background(cst.BACKGROUND_TITLE)
+            else:
+                self._display.fill(cst.BLACK)
+            text_loading.draw()
+            pg.draw.rect(self._display, cst.GREEN, bar, 2)
+            pg.draw.rect(self._display, cst.GREEN, (bar.x, bar.y, int(bar.width * progress), bar.height))
+            self._screen.invalidate()
+            self._present([])
+
+            for event in pg.event.get():
+                if event.type == QUIT:
+                    self._quit()
+
+            if self.__preloader.finished:
+                self.waiting_player = False
+            else:
+                self._clock.tick(cst.FPS)
+
+
 class Title(Interface):
     """
     Classe que controla a interface de Tela de Início do jogo.
@@ -341,40 +584,27 @@ class Title(Interface):
         None.
         """
 
-        if not pg.mixer.music.get_busy():
+        if not rs.sound_bank.music_busy():
             try:
-                pg.mixer.music.load(cst.MUSIC_TITLE)
-                pg.mixer.music.play(-1)
-            except pg.error as e:
+                rs.sound_bank.play_music(cst.MUSIC_TITLE)
+            except eg.SoundLoadError as e:
                 raise eg.MusicLoadError(f"Detalhes do erro: {e}")
 
         text_title = Text(self._display, "SPACIAL GAME", cst.FONT, cst.GREEN, 90, [self._width // 2, 200])
         play_button = Button(self._display, "PLAY", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 250], 150, 30)
         credits_button = Button(self._display, "CREDITS", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 180], 150, 30)
         exit_button = Button(self._display, "EXIT", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 110], 150, 30)
+        self._compose(cst.BACKGROUND_TITLE, [text_title])
 
+        buttons = [play_button, credits_button, exit_button]
         while self.waiting_player:
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    self._quit()
+            self._present(self._draw_buttons(buttons))
+            self._wait_events(buttons)
 
             self.handle_button_press(play_button)
             self.handle_button_press(credits_button)
             self.handle_button_press(exit_button)
 
-            self._load_background(cst.BACKGROUND_TITLE)
-
-            text_title.draw()
-            play_button.draw()
-            credits_button.draw()
-            exit_button.draw()
-
-            self._clock.tick(cst.FPS)
-            try:
-                pg.display.update()
-            except pg.error as e:
-                raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
-
 
 class Credits(Interface):
     """
@@ -415,26 +645,14 @@ class Credits(Interface):
         colaborador_3 = Text(self._display, "Guilherme Ferrari", cst.FONT, cst.WHITE, 30, [self._width // 2, 310])
         colaborador_4 = Text(self._display, "Jeann Rocha", cst.FONT, cst.WHITE, 30, [self._width // 2, 380])
         exit_button = Button(self._display, "RETURN TO MENU", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 110], 220, 30)
+        self._compose(cst.BACKGROUND_PAUSE, [text_colaboradores, colaborador_1, colaborador_2, colaborador_3, colaborador_4])
 
+        buttons = [exit_button]
         while self.waiting_player:
-            for event in pg.event.get():
-                if event.type == QUIT:
-                    self._quit()
-            self.handle_button_press(exit_button)
-            self._load_background(cst.BACKGROUND_PAUSE)
-
-            text_colaboradores.draw()
-            colaborador_1.draw()
-            colaborador_2.draw()
-            colaborador_3.draw()
-            colaborador_4.draw()
-            exit_button.draw()
+            self._present(self._draw_buttons(buttons))
+            self._wait_events(buttons)
 
-            self._clock.tick(cst.FPS)
-            try:
-                pg.display.update()
-            except pg.error as e:
-                raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
+            self.handle_button_press(exit_button)
 
 
 class Pause(Interface):
@@ -473,28 +691,16 @@ class Pause(Interface):
         text_pause = Text(self._display, "PAUSE", cst.FONT, cst.GREEN, 90, [self._width // 2, 200])
         return_game_button = Button(self._display, "RETURN TO GAME", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 250], 220, 30)
         return_menu_button = Button(self._display, "RETURN TO MENU", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 180], 220, 30)
+        self._compose(cst.BACKGROUND_PAUSE, [text_pause])
 
+        buttons = [return_game_button, return_menu_button]
         while self.waiting_player:
-
-            for event in pg.event.get():
-                if event.type == QUIT:
-                    self._quit()
+            self._present(self._draw_buttons(buttons))
+            self._wait_events(buttons)
 
             self.handle_button_press(return_game_button)
             self.handle_button_press(return_menu_button)
 
-            self._load_background(cst.BACKGROUND_PAUSE)
-
-            text_pause.draw()
-            return_game_button.draw()
-            return_menu_button.draw()
-
-            self._clock.tick(cst.FPS)
-            try:
-                pg.display.update()
-            except pg.error as e:
-                raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
-
 
 class Reset(Interface):
     """
@@ -536,24 +742,12 @@ class Reset(Interface):
         score_button = Button(self._display, f"SCORE: {self.__score}", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 440], 220, 30, is_selected=False)
         return_menu_button = Button(self._display, "RETURN TO MENU", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 370], 220, 30)
         exit_button = Button(self._display, "EXIT", cst.FONT, cst.GREEN, 20, [self._width // 2, self._height - 300], 220, 30)
+        self._compose(cst.BACKGROUND_GAMEOVER, [text_tryagain])
 
+        buttons = [score_button, return_menu_button, exit_button]
         while self.waiting_player:
-            for event in pg.event.get():
-                if event.type == QUIT:
-                    self._quit()
+            self._present(self._draw_buttons(buttons))
+            self._wait_events(buttons)
 
             self.handle_button_press(return_menu_button)
             self.handle_button_press(exit_button)
-
-            self._load_background(cst.BACKGROUND_GAMEOVER)
-
-            text_tryagain.draw()
-            score_button.draw()
-            return_menu_button.draw()
-            exit_button.draw()
-
-            self._clock.tick(cst.FPS)
-            try:
-                pg.display.update()
-            except pg.error as e:
-                raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
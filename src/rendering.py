@@ -0,0 +1,102 @@
+"""
+Módulo que contém o controle de atualização da tela (modo de retângulos sujos).
+"""
+
+# Importando as bibliotecas
+import pygame as pg
+
+import exception_game as eg
+
+
+class ScreenUpdater:
+    """
+    Classe que acumula as regiões da tela alteradas em um quadro e as envia em uma
+    única chamada de pg.display.update, recorrendo à atualização completa quando a
+    tela inteira foi invalidada (por exemplo, pelo background em movimento).
+    """
+
+    def __init__(self, display: pg.Surface, enabled=True) -> None:
+        """
+        Método construtor da classe ScreenUpdater.
+
+        Parameters
+        ----------
+        display : pg.Surface
+            Tela onde acontece o jogo.
+        enabled : bool (Opcional)
+            Se falso, toda atualização é completa (modo de retângulos sujos desligado).
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__screen_rect = display.get_rect()
+        self.__enabled = enabled
+        self.__rects = [] # regiões alteradas no quadro atual
+        self.__previous = [] # regiões alteradas no quadro anterior (precisam ser apagadas)
+        self.__full = True # o primeiro quadro é sempre completo
+
+        self.full_updates = 0 # quantidade de atualizações completas
+        self.partial_updates = 0 # quantidade de atualizações parciais
+
+    def add(self, rects: list) -> None:
+        """
+        Método que marca regiões da tela como alteradas.
+
+        Parameters
+        ----------
+        rects : list
+            Lista de retângulos alterados.
+
+        Returns
+        -------
+        None.
+        """
+
+        for rect in rects:
+            if rect.contains(self.__screen_rect):
+                self.__full = True
+            else:
+                self.__rects.append(rect.clip(self.__screen_rect))
+
+    def invalidate(self) -> None:
+        """
+        Método que marca a tela inteira como alterada.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__full = True
+
+    def flush(self) -> None:
+        """
+        Método que envia as regiões alteradas para a tela (uma única chamada por quadro).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        try:
+            if self.__full or not self.__enabled:
+                pg.display.update()
+                self.full_updates += 1
+            elif self.__rects or self.__previous:
+                # as posições antigas também são enviadas, para apagar o que saiu delas
+                pg.display.update(self.__previous + self.__rects)
+                self.partial_updates += 1
+        except pg.error as e:
+            raise eg.UpdateScreenError(f"Detalhes do erro: {e}")
+
+        self.__previous = self.__rects
+        self.__rects = []
+        self.__full = False
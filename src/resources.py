@@ -0,0 +1,1265 @@
+"""
+Módulo que contém o cache de recursos (imagens, sons, arquivos e textos) compartilhado
+por todo o jogo e o pré-carregamento desses recursos na inicialização.
+"""
+
+# Importando as bibliotecas
+import io
+import os
+import glob
+import json
+import mmap
+import weakref
+import hashlib
+from os.path import join, splitext, exists, getmtime, getsize
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame as pg
+
+import constants as cst
+import exception_game as eg
+
+
+class ImageCache:
+    """
+    Classe que carrega, escalona e guarda as imagens do jogo, de forma que cada
+    imagem seja lida do disco uma única vez por escala.
+    """
+
+    def __init__(self) -> None:
+        """
+        Método construtor da classe ImageCache.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__surfaces = {} # superfícies guardadas, indexadas por (caminho, escala)
+        self.__sequences = {} # sequências de animação, indexadas por (caminhos, escala)
+        self.__masks = {} # máscaras de colisão das sequências, indexadas por (caminhos, escala)
+        self.hits = 0 # quantidade de imagens entregues a partir do cache
+        self.misses = 0 # quantidade de imagens que precisaram ser carregadas do disco
+        self.bytes = 0 # quantidade de bytes ocupada pelas superfícies guardadas
+
+    def load(self, path: str, scale: list) -> pg.Surface:
+        """
+        Método que devolve a imagem escalonada de um caminho, carregando-a do
+        disco apenas na primeira vez em que é pedida.
+
+        Parameters
+        ----------
+        path : str
+            Caminho da imagem.
+        scale : list
+            Lista contendo os valores x e y da escala da imagem.
+
+        Returns
+        -------
+        pg.Surface
+            Imagem escalonada (compartilhada, não deve ser alterada).
+        """
+
+        key = (path, tuple(scale))
+        surface = self.__surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        return self.store(path, scale, decode_image(path, scale))
+
+    def store(self, path: str, scale: list, surface: pg.Surface) -> pg.Surface:
+        """
+        Método que guarda uma imagem já decodificada e escalonada (por exemplo, pelo
+        pré-carregamento), convertendo-a para o formato da tela.
+
+        Parameters
+        ----------
+        path : str
+            Caminho da imagem.
+        scale : list
+            Lista contendo os valores x e y da escala da imagem.
+        surface : pg.Surface
+            Imagem escalonada.
+
+        Returns
+        -------
+        pg.Surface
+            Imagem guardada.
+        """
+
+        # converte para o formato da tela (quando ela já existe) para acelerar os blits
+        if pg.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        self.__surfaces[(path, tuple(scale))] = surface
+        self.bytes += surface.get_pitch() * surface.get_height()
+        return surface
+
+    def store_atlas(self, atlas: pg.Surface, frames: dict) -> None:
+        """
+        Método que guarda os quadros de um atlas de sprites, como recortes
+        (subsuperfícies) da imagem do atlas, convertida uma única vez.
+
+        Parameters
+        ----------
+        atlas : pg.Surface
+            Imagem do atlas.
+        frames : dict
+            Dicionário (caminho, escala) -> retângulo do quadro no atlas.
+
+        Returns
+        -------
+        None.
+        """
+
+        if pg.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        for key, rect in frames.items():
+            self.__surfaces[key] = atlas.subsurface(rect)
+        self.bytes += atlas.get_pitch() * atlas.get_height()
+
+    def contains(self, path: str, scale: list) -> bool:
+        """
+        Método que indica se uma imagem já está no cache.
+
+        Parameters
+        ----------
+        path : str
+            Caminho da imagem.
+        scale : list
+            Lista contendo os valores x e y da escala da imagem.
+
+        Returns
+        -------
+        bool
+            Verdadeiro se a imagem já foi carregada.
+        """
+
+        return (path, tuple(scale)) in self.__surfaces
+
+    def load_images(self, paths: list, scale: list) -> list:
+        """
+        Método que devolve o conjunto de imagens escalonadas de uma lista de caminhos.
+
+        Parameters
+        ----------
+        paths : list
+            Lista contendo os caminhos das imagens.
+        scale : list
+            Lista contendo os valores x e y da escala das imagens.
+
+        Returns
+        -------
+        list
+            Lista de imagens escalonadas.
+        """
+
+        return [self.load(path, scale) for path in paths]
+
+    def load_sequence(self, paths: list, scale: list) -> tuple:
+        """
+        Método que devolve uma sequência de animação escalonada, montada uma
+        única vez por escala e compartilhada por todos os sprites que a usam.
+
+        Parameters
+        ----------
+        paths : list
+            Lista contendo os caminhos dos quadros da animação.
+        scale : list
+            Lista contendo os valores x e y da escala dos quadros.
+
+        Returns
+        -------
+        tuple
+            Tupla (imutável) de quadros escalonados.
+        """
+
+        key = (tuple(paths), tuple(scale))
+        sequence = self.__sequences.get(key)
+        if sequence is None:
+            sequence = tuple(self.load_images(paths, scale))
+            self.__sequences[key] = sequence
+        else:
+            self.hits += len(sequence)
+        return sequence
+
+    def load_mask_sequence(self, paths: list, scale: list) -> tuple:
+        """
+        Método que devolve as máscaras de colisão de uma sequência de animação,
+        construídas uma única vez por quadro e compartilhadas pelos sprites.
+
+        Parameters
+        ----------
+        paths : list
+            Lista contendo os caminhos dos quadros da animação.
+        scale : list
+            Lista contendo os valores x e y da escala dos quadros.
+
+        Returns
+        -------
+        tuple
+            Tupla de máscaras, na mesma ordem dos quadros de load_sequence.
+        """
+
+        key = (tuple(paths), tuple(scale))
+        masks = self.__masks.get(key)
+        if masks is None:
+            masks = tuple(pg.mask.from_surface(frame) for frame in self.load_sequence(paths, scale))
+            self.__masks[key] = masks
+        return masks
+
+    def stats(self) -> dict:
+        """
+        Método que informa o uso do cache.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        dict
+            Dicionário com acertos, faltas, quantidade de imagens e bytes guardados.
+        """
+
+        return {"hits": self.hits, "misses": self.misses, "images": len(self.__surfaces), "bytes": self.bytes}
+
+    def clear(self) -> None:
+        """
+        Método que esvazia o cache e zera as estatísticas.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__surfaces.clear()
+        self.__sequences.clear()
+        self.__masks.clear()
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+
+
+class SoundBank:
+    """
+    Classe que decodifica os efeitos sonoros uma única vez e os toca através de
+    um pool de canais, limitando a quantidade de vozes e a frequência de cada efeito.
+    """
+
+    def __init__(self, limits: dict) -> None:
+        """
+        Método construtor da classe SoundBank.
+
+        Parameters
+        ----------
+        limits : dict
+            Dicionário caminho -> (máximo de vozes, intervalo mínimo em ms, prioridade).
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__limits = limits
+        self.__sounds = {} # efeitos (e músicas) já decodificados, indexados pelo caminho
+        self.__music_channel = None # canal reservado para a música
+        self.__channels = [] # pool de canais dos efeitos (nunca inclui o canal da música)
+        self.__channel_order = [] # ordem do último disparo em cada canal do pool (o menor é o mais antigo)
+        self.__music = None # caminho da música tocando no canal reservado
+        self.__last_play = {} # instante (ms) da última vez que cada efeito tocou
+        self.clock = None # relógio da simulação: se definido, os intervalos são medidos no tempo do jogo
+        self.played = 0 # quantidade de efeitos tocados
+        self.dropped = 0 # quantidade de efeitos descartados pelos limites
+
+    def load_all(self, channels: int) -> None:
+        """
+        Método que reserva o pool de canais (mais um canal exclusivo para a música)
+        e decodifica todos os efeitos conhecidos.
+
+        Parameters
+        ----------
+        channels : int
+            Quantidade de canais do mixer para os efeitos.
+
+        Returns
+        -------
+        None.
+        """
+
+        if not pg.mixer.get_init():
+            return
+        pg.mixer.set_num_channels(channels + 1)
+        # o canal 0 fica fora da alocação automática do SDL_mixer (Sound.play), mas
+        # find_channel ignora a reserva: os efeitos usam apenas o pool próprio (1..channels)
+        pg.mixer.set_reserved(1)
+        self.__music_channel = pg.mixer.Channel(0)
+        self.__channels = [pg.mixer.Channel(i) for i in range(1, channels + 1)]
+        self.__channel_order = [0] * channels
+        for path in self.__limits:
+            self.__load(path)
+
+    def __load(self, path: str) -> pg.mixer.Sound:
+        """
+        Método que decodifica um efeito sonoro (apenas na primeira vez).
+
+        Parameters
+        ----------
+        path : str
+            Caminho do efeito sonoro.
+
+        Returns
+        -------
+        pg.mixer.Sound
+            Efeito sonoro decodificado.
+        """
+
+        sound = self.__sounds.get(path)
+        if sound is None:
+            sound = decode_sound(path)
+            self.__sounds[path] = sound
+        return sound
+
+    def store(self, path: str, sound: pg.mixer.Sound) -> None:
+        """
+        Método que guarda um efeito sonoro já decodificado (por exemplo, pelo pré-carregamento).
+
+        Parameters
+        ----------
+        path : str
+            Caminho do efeito sonoro.
+        sound : pg.mixer.Sound
+            Efeito sonoro decodificado.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__sounds[path] = sound
+
+    def play(self, path: str) -> bool:
+        """
+        Método que toca um efeito sonoro respeitando seus limites de vozes e frequência.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do efeito sonoro.
+
+        Returns
+        -------
+        bool
+            Verdadeiro se o efeito foi tocado.
+        """
+
+        if not pg.mixer.get_init():
+            return False
+
+        max_voices, min_interval, priority = self.__limits.get(path, (1, 0, False))
+        sound = self.__load(path)
+        now = self.clock.now * 1000 if self.clock is not None else pg.time.get_ticks()
+
+        # limite de frequência e de vozes simultâneas do efeito (o tempo do jogo volta a zero
+        # a cada partida, então um instante anterior ao último disparo não bloqueia o efeito)
+        elapsed = now - self.__last_play.get(path, -min_interval)
+        if 0 <= elapsed < min_interval or sound.get_num_channels() >= max_voices:
+            self.dropped += 1
+            return False
+
+        # canal livre do pool (efeitos com prioridade tomam o canal mais antigo)
+        index = self.__find_channel(priority)
+        if index is None:
+            self.dropped += 1
+            return False
+
+        self.__channels[index].play(sound)
+        self.__channel_order[index] = self.played
+        self.__last_play[path] = now
+        self.played += 1
+        return True
+
+    def __find_channel(self, priority: bool):
+        """
+        Método que escolhe o canal do pool em que um efeito vai tocar.
+
+        Parameters
+        ----------
+        priority : bool
+            Se verdadeiro e não houver canal livre, devolve o canal com o efeito mais antigo.
+
+        Returns
+        -------
+        int ou None
+            Índice do canal no pool ou None se não houver canal disponível.
+        """
+
+        for index, channel in enumerate(self.__channels):
+            if not channel.get_busy():
+                return index
+        if priority and self.__channels:
+            return min(range(len(self.__channels)), key=self.__channel_order.__getitem__)
+        return None
+
+    def play_music(self, path: str, volume=1.0) -> None:
+        """
+        Método que toca uma música em loop no canal reservado (a música já
+        decodificada é reaproveitada a cada troca, sem nova decodificação).
+
+        Parameters
+        ----------
+        path : str
+            Caminho da música.
+        volume : float (Opcional)
+            Volume da música, entre 0 e 1.
+
+        Returns
+        -------
+        None.
+        """
+
+        if self.__music_channel is None:
+            return
+        self.__music_channel.play(self.__load(path), loops=-1)
+        self.__music_channel.set_volume(volume)
+        self.__music = path
+
+    def stop_music(self) -> None:
+        """
+        Método que interrompe a música.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        if self.__music_channel is not None:
+            self.__music_channel.stop()
+        self.__music = None
+
+    def music_busy(self) -> bool:
+        """
+        Método que indica se alguma música está tocando.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        bool
+            Verdadeiro se há música tocando no canal reservado.
+        """
+
+        return self.__music is not None and self.__music_channel is not None and self.__music_channel.get_busy()
+
+    def stats(self) -> dict:
+        """
+        Método que informa o uso do banco de sons.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        dict
+            Dicionário com efeitos carregados, tocados e descartados.
+        """
+
+        return {"sounds": len(self.__sounds), "played": self.played, "dropped": self.dropped}
+
+
+class GlyphAtlas:
+    """
+    Classe que rasteriza, uma única vez, os caracteres de uma fonte (em um tamanho
+    e uma cor) em uma única superfície, montando os textos a partir dela.
+    """
+
+    def __init__(self, font: pg.font.Font, color: tuple, charset: str) -> None:
+        """
+        Método construtor da classe GlyphAtlas.
+
+        Parameters
+        ----------
+        font : pg.font.Font
+            Fonte já carregada.
+        color : tuple
+            Tupla contendo os valores RGB da cor do texto.
+        charset : str
+            Caracteres rasterizados inicialmente.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__font = font
+        self.__color = color
+        self.__glyphs = {} # caractere -> retângulo do caractere no atlas
+        self.__surface = None
+        self.__build(charset)
+
+    def __build(self, charset: str) -> None:
+        """
+        Método que (re)constrói o atlas com um conjunto de caracteres.
+
+        Parameters
+        ----------
+        charset : str
+            Caracteres do atlas.
+
+        Returns
+        -------
+        None.
+        """
+
+        glyphs = [(char, self.__font.render(char, True, self.__color)) for char in charset]
+        width = sum(glyph.get_width() for _, glyph in glyphs)
+        self.__surface = pg.Surface((max(width, 1), self.__font.get_height()), pg.SRCALPHA)
+        self.__glyphs = {}
+        x = 0
+        for char, glyph in glyphs:
+            self.__surface.blit(glyph, (x, 0))
+            self.__glyphs[char] = pg.Rect(x, 0, glyph.get_width(), glyph.get_height())
+            x += glyph.get_width()
+
+    def render(self, text: str) -> pg.Surface:
+        """
+        Método que monta um texto copiando seus caracteres do atlas.
+
+        Parameters
+        ----------
+        text : str
+            Texto que será montado.
+
+        Returns
+        -------
+        pg.Surface
+            Superfície com o texto.
+        """
+
+        # caracteres ainda não rasterizados entram no atlas (reconstruído uma única vez para eles)
+        missing = "".join(dict.fromkeys(char for char in text if char not in self.__glyphs))
+        if missing:
+            self.__build("".join(self.__glyphs) + missing)
+
+        width = sum(self.__glyphs[char].width for char in text)
+        surface = pg.Surface((max(width, 1), self.__font.get_height()), pg.SRCALPHA)
+        x = 0
+        for char in text:
+            area = self.__glyphs[char]
+            # BLEND_RGBA_MAX copia o caractere (com a transparência) sem escurecer as bordas
+            surface.blit(self.__surface, (x, 0), area, pg.BLEND_RGBA_MAX)
+            x += area.width
+        return surface
+
+
+class TextCache:
+    """
+    Classe que guarda as fontes por (caminho, tamanho), os atlas de caracteres
+    por (fonte, tamanho, cor) e os textos já montados.
+    """
+
+    def __init__(self, max_strings=256) -> None:
+        """
+        Método construtor da classe TextCache.
+
+        Parameters
+        ----------
+        max_strings : int (Opcional)
+            Quantidade máxima de textos montados guardados.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__fonts = {} # (caminho, tamanho) -> pg.font.Font
+        self.__atlases = {} # (caminho, tamanho, cor) -> GlyphAtlas
+        self.__strings = {} # (texto, caminho, tamanho, cor) -> pg.Surface
+        self.__max_strings = max_strings
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, path: str, size: int) -> pg.font.Font:
+        """
+        Método que devolve a fonte de um caminho e tamanho, lendo o arquivo uma única vez.
+
+        Parameters
+        ----------
+        path : str
+            Caminho da fonte.
+        size : int
+            Tamanho do texto.
+
+        Returns
+        -------
+        pg.font.Font
+            Fonte carregada.
+        """
+
+        key = (path, size)
+        font = self.__fonts.get(key)
+        if font is None:
+            font = pg.font.Font(file_cache.open(path), size)
+            self.__fonts[key] = font
+        return font
+
+    def render(self, text: str, path: str, size: int, color: tuple) -> pg.Surface:
+        """
+        Método que devolve a superfície de um texto, montando-a apenas na primeira vez.
+
+        Parameters
+        ----------
+        text : str
+            Texto que será exibido.
+        path : str
+            Caminho da fonte.
+        size : int
+            Tamanho do texto.
+        color : tuple
+            Tupla contendo os valores RGB da cor do texto.
+
+        Returns
+        -------
+        pg.Surface
+            Superfície com o texto (compartilhada, não deve ser alterada).
+        """
+
+        key = (text, path, size, tuple(color))
+        surface = self.__strings.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        atlas = self.__atlases.get(key[1:])
+        if atlas is None:
+            atlas = GlyphAtlas(self.font(path, size), color, cst.CHARSET)
+            self.__atlases[key[1:]] = atlas
+        surface = atlas.render(text)
+
+        # descarta o texto mais antigo quando o limite é atingido (ex.: pontuações antigas)
+        if len(self.__strings) >= self.__max_strings:
+            del self.__strings[next(iter(self.__strings))]
+        self.__strings[key] = surface
+        return surface
+
+    def stats(self) -> dict:
+        """
+        Método que informa o uso do cache de textos.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        dict
+            Dicionário com fontes, atlas, textos guardados, acertos e faltas.
+        """
+
+        return {"fonts": len(self.__fonts), "atlases": len(self.__atlases), "strings": len(self.__strings), "hits": self.hits, "misses": self.misses}
+
+
+class PixelCache:
+    """
+    Classe que guarda em disco os pixels (RGBA) das imagens já decodificadas e
+    escalonadas, indexados pelo hash do arquivo de origem e pela escala. Nas
+    inicializações seguintes, os pixels são mapeados na memória (mmap), sem
+    decodificação nem escalonamento. Se a imagem de origem mudar, o hash muda
+    e a entrada antiga é substituída.
+    """
+
+    def __init__(self, directory) -> None:
+        """
+        Método construtor da classe PixelCache.
+
+        Parameters
+        ----------
+        directory : str
+            Pasta do cache em disco (None desabilita o cache).
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__directory = directory
+        self.mapped = 0 # mapeamentos abertos (cada um vive enquanto a superfície lida dele existir)
+        self.hits = 0
+        self.misses = 0
+
+    def file(self, path: str, scale: list):
+        """
+        Método que monta o nome do arquivo de cache de uma imagem (lendo e calculando
+        o hash da imagem de origem, por isso deve ser chamado uma única vez por imagem).
+
+        Parameters
+        ----------
+        path : str
+            Caminho da imagem.
+        scale : list
+            Lista contendo os valores x e y da escala da imagem.
+
+        Returns
+        -------
+        tuple ou None
+            Caminho do arquivo de cache e prefixo comum a todas as versões da imagem nessa
+            escala, ou None se o cache estiver desabilitado ou a imagem não existir.
+        """
+
+        if self.__directory is None or not exists(path):
+            return None
+        return cache_file(self.__directory, path, f"{scale[0]}x{scale[1]}", ".rgba")
+
+    def get(self, cache_path: str, scale: list):
+        """
+        Método que devolve os pixels guardados de uma imagem, se existirem. A imagem
+        devolvida aponta para o arquivo mapeado, que é fechado assim que ela deixa de
+        existir (depois da conversão para o formato da tela, que copia os pixels).
+
+        Parameters
+        ----------
+        cache_path : str
+            Caminho do arquivo de cache (ver o método file).
+        scale : list
+            Lista contendo os valores x e y da escala da imagem.
+
+        Returns
+        -------
+        pg.Surface ou None
+            Imagem escalonada (sem a conversão para o formato da tela) ou None.
+        """
+
+        size = (scale[0], scale[1])
+        if not exists(cache_path) or getsize(cache_path) != size[0] * size[1] * 4:
+            self.misses += 1
+            return None
+
+        with open(cache_path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        surface = pg.image.frombuffer(buffer, size, "RGBA")
+        self.mapped += 1
+        weakref.finalize(surface, self.__unmap, buffer)
+        self.hits += 1
+        return surface
+
+    def __unmap(self, buffer: mmap.mmap) -> None:
+        """
+        Método que fecha o mapeamento de uma imagem que deixou de existir.
+
+        Parameters
+        ----------
+        buffer : mmap.mmap
+            Mapeamento do arquivo de cache.
+
+        Returns
+        -------
+        None.
+        """
+
+        buffer.close()
+        self.mapped -= 1
+
+    def put(self, cache_path: str, prefix: str, surface: pg.Surface) -> None:
+        """
+        Método que guarda os pixels de uma imagem, removendo as versões antigas dela.
+
+        Parameters
+        ----------
+        cache_path : str
+            Caminho do arquivo de cache (ver o método file).
+        prefix : str
+            Prefixo comum a todas as versões da imagem nessa escala.
+        surface : pg.Surface
+            Imagem escalonada.
+
+        Returns
+        -------
+        None.
+        """
+
+        write_cache_file(cache_path, prefix, pg.image.tobytes(surface, "RGBA"))
+
+    def stats(self) -> dict:
+        """
+        Método que informa o uso do cache de pixels.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        dict
+            Dicionário com acertos, faltas e mapeamentos abertos.
+        """
+
+        return {"hits": self.hits, "misses": self.misses, "mapped": self.mapped}
+
+
+class AudioCache:
+    """
+    Classe que guarda em disco o áudio já decodificado (PCM cru, no formato do
+    mixer) dos efeitos sonoros e das músicas, indexado pelo hash do arquivo de
+    origem e pelo formato do mixer. Nas inicializações seguintes, os sons são
+    montados direto a partir do PCM, sem decodificar mp3/wav.
+    """
+
+    def __init__(self, directory) -> None:
+        """
+        Método construtor da classe AudioCache.
+
+        Parameters
+        ----------
+        directory : str
+            Pasta do cache em disco (None desabilita o cache).
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def decode(self, path: str) -> pg.mixer.Sound:
+        """
+        Método que devolve um som decodificado, a partir do PCM guardado (se existir
+        e ainda corresponder ao arquivo de origem) ou decodificando o arquivo.
+
+        Parameters
+        ----------
+        path : str
+            Caminho do som.
+
+        Returns
+        -------
+        pg.mixer.Sound
+            Som decodificado.
+        """
+
+        if self.__directory is None:
+            return pg.mixer.Sound(path)
+
+        frequency, size, channels = pg.mixer.get_init()
+        cache_path, prefix = cache_file(self.__directory, path, f"{frequency}_{size}_{channels}", ".pcm")
+        if exists(cache_path):
+            self.hits += 1
+            with open(cache_path, "rb") as file:
+                return pg.mixer.Sound(buffer=file.read())
+
+        self.misses += 1
+        sound = pg.mixer.Sound(path)
+        write_cache_file(cache_path, prefix, sound.get_raw())
+        return sound
+
+    def stats(self) -> dict:
+        """
+        Método que informa o uso do cache de áudio.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        dict
+            Dicionário com acertos e faltas.
+        """
+
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class FileCache:
+    """
+    Classe que guarda na memória o conteúdo bruto dos arquivos lidos em fluxo
+    (fontes), de forma que cada arquivo seja lido do disco uma única vez.
+    """
+
+    def __init__(self) -> None:
+        """
+        Método construtor da classe FileCache.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__files = {} # caminho -> bytes do arquivo
+
+    def store(self, path: str, data: bytes) -> None:
+        """
+        Método que guarda o conteúdo de um arquivo já lido (por exemplo, pelo pré-carregamento).
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo.
+        data : bytes
+            Conteúdo do arquivo.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__files[path] = data
+
+    def open(self, path: str) -> io.BytesIO:
+        """
+        Método que devolve um novo fluxo de leitura do conteúdo de um arquivo
+        (cada fonte aberta pelo pygame precisa do seu próprio fluxo).
+
+        Parameters
+        ----------
+        path : str
+            Caminho do arquivo.
+
+        Returns
+        -------
+        io.BytesIO
+            Fluxo com o conteúdo do arquivo.
+        """
+
+        data = self.__files.get(path)
+        if data is None:
+            data = read_file(path)
+            self.__files[path] = data
+        return io.BytesIO(data)
+
+
+def cache_file(directory: str, path: str, variant: str, extension: str) -> tuple:
+    """
+    Função que monta o nome do arquivo de um cache em disco, a partir do caminho
+    e do conteúdo (hash) do arquivo de origem.
+
+    Parameters
+    ----------
+    directory : str
+        Pasta do cache.
+    path : str
+        Caminho do arquivo de origem.
+    variant : str
+        Variação do recurso guardado (por exemplo, a escala da imagem).
+    extension : str
+        Extensão do arquivo de cache.
+
+    Returns
+    -------
+    tuple
+        Caminho do arquivo de cache e prefixo comum a todas as versões do recurso nessa variação.
+    """
+
+    with open(path, "rb") as file:
+        digest = hashlib.sha1(file.read()).hexdigest()
+    prefix = f"{hashlib.sha1(path.encode()).hexdigest()[:16]}_{variant}_"
+    return join(directory, prefix + digest + extension), prefix
+
+
+def write_cache_file(cache_path: str, prefix: str, data: bytes) -> None:
+    """
+    Função que grava um arquivo de cache, removendo as versões antigas do mesmo recurso.
+
+    Parameters
+    ----------
+    cache_path : str
+        Caminho do arquivo de cache.
+    prefix : str
+        Prefixo comum a todas as versões do recurso.
+    data : bytes
+        Conteúdo do arquivo.
+
+    Returns
+    -------
+    None.
+    """
+
+    directory = os.path.dirname(cache_path)
+    os.makedirs(directory, exist_ok=True)
+    extension = splitext(cache_path)[1]
+    for old in glob.glob(join(directory, prefix + "*" + extension)):
+        if old != cache_path:
+            os.remove(old)
+
+    # escrita atômica: outra thread (ou execução) nunca vê um arquivo pela metade
+    temp_path = f"{cache_path}.{os.getpid()}.{id(data)}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, cache_path)
+
+
+def decode_image(path: str, scale: list) -> pg.Surface:
+    """
+    Função que lê e escalona uma imagem (pode ser executada fora da thread principal,
+    pois não depende do formato da tela).
+
+    Parameters
+    ----------
+    path : str
+        Caminho da imagem.
+    scale : list
+        Lista contendo os valores x e y da escala da imagem.
+
+    Returns
+    -------
+    pg.Surface
+        Imagem escalonada (ainda sem a conversão para o formato da tela).
+    """
+
+    # o hash da imagem de origem é calculado uma única vez, para a leitura e a gravação
+    cache = pixel_cache.file(path, scale)
+    if cache is not None:
+        surface = pixel_cache.get(cache[0], scale)
+        if surface is not None:
+            return surface
+
+    try:
+        surface = pg.transform.scale(pg.image.load(path), scale)
+    except (pg.error, FileNotFoundError) as e:
+        raise eg.ImageLoadError(f"Detalhes do erro: {e}")
+    if cache is not None:
+        pixel_cache.put(*cache, surface)
+    return surface
+
+
+def decode_sound(path: str) -> pg.mixer.Sound:
+    """
+    Função que lê e decodifica um efeito sonoro ou uma música (pode ser executada
+    fora da thread principal).
+
+    Parameters
+    ----------
+    path : str
+        Caminho do som.
+
+    Returns
+    -------
+    pg.mixer.Sound
+        Efeito sonoro decodificado.
+    """
+
+    try:
+        return audio_cache.decode(path)
+    except (pg.error, FileNotFoundError) as e:
+        raise eg.SoundLoadError(f"Detalhes do erro: {e}")
+
+
+def read_atlas_index(image_path: str, index_path: str) -> dict:
+    """
+    Função que lê o índice do atlas de sprites (gerado por atlas.py), descartando os
+    quadros cujo arquivo de origem mudou depois da geração.
+
+    Parameters
+    ----------
+    image_path : str
+        Caminho da imagem do atlas.
+    index_path : str
+        Caminho do índice do atlas.
+
+    Returns
+    -------
+    dict
+        Dicionário (caminho, escala) -> retângulo do quadro no atlas (vazio se não houver atlas).
+    """
+
+    if not (exists(image_path) and exists(index_path)):
+        return {}
+    try:
+        with open(index_path) as file:
+            index = json.load(file)
+        return {(frame["path"], tuple(frame["scale"])): pg.Rect(frame["rect"]) for frame in index["frames"]
+                if exists(frame["path"]) and getmtime(frame["path"]) == frame["mtime"]}
+    except (ValueError, KeyError, TypeError):
+        return {} # índice inválido: as imagens são lidas uma a uma
+
+
+def read_file(path: str) -> bytes:
+    """
+    Função que lê o conteúdo bruto de um arquivo.
+
+    Parameters
+    ----------
+    path : str
+        Caminho do arquivo.
+
+    Returns
+    -------
+    bytes
+        Conteúdo do arquivo.
+    """
+
+    with open(path, "rb") as file:
+        return file.read()
+
+
+class Preloader:
+    """
+    Classe que lê e decodifica, em um pool de threads, todos os recursos listados
+    nas constantes, entregando-os aos caches na thread principal (onde as imagens
+    são convertidas para o formato da tela). Depois dele, nenhum arquivo é lido
+    durante a partida.
+    """
+
+    def __init__(self, images: list, sounds: list, files: list, workers: int, atlas=None) -> None:
+        """
+        Método construtor da classe Preloader.
+
+        Parameters
+        ----------
+        images : list
+            Lista de tuplas (caminhos, escala) das sequências de imagens.
+        sounds : list
+            Lista de caminhos dos efeitos sonoros e das músicas.
+        files : list
+            Lista de caminhos dos arquivos lidos em fluxo (fontes).
+        workers : int
+            Quantidade de threads do pool.
+        atlas : tuple (Opcional)
+            Tupla (imagem, índice) do atlas de sprites; os quadros contidos nele não
+            são lidos individualmente.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__jobs = []
+        self.__atlas_frames = {}
+        if atlas is not None:
+            self.__atlas_frames = read_atlas_index(*atlas)
+            if self.__atlas_frames:
+                self.__jobs.append(("atlas", atlas[0], None))
+
+        # trabalhos únicos (a mesma imagem pode aparecer em mais de uma sequência)
+        for paths, scale in images:
+            for path in paths:
+                job = ("image", path, tuple(scale))
+                if job not in self.__jobs and job[1:] not in self.__atlas_frames:
+                    self.__jobs.append(job)
+        if pg.mixer.get_init():
+            self.__jobs.extend(("sound", path, None) for path in sounds)
+        self.__jobs.extend(("file", path, None) for path in files)
+
+        self.__workers = workers
+        self.__executor = None
+        self.__pending = []
+        self.done = 0
+
+    @property
+    def total(self) -> int:
+        """
+        Quantidade de recursos a carregar.
+        """
+
+        return len(self.__jobs)
+
+    @property
+    def finished(self) -> bool:
+        """
+        Indica se todos os recursos já foram entregues aos caches.
+        """
+
+        return self.done == self.total
+
+    @staticmethod
+    def __decode(kind: str, path: str, scale: tuple):
+        """
+        Método executado nas threads do pool: lê e decodifica um recurso.
+
+        Parameters
+        ----------
+        kind : str
+            Tipo do recurso ("atlas", "image", "sound" ou "file").
+        path : str
+            Caminho do recurso.
+        scale : tuple
+            Escala da imagem (apenas para imagens).
+
+        Returns
+        -------
+        pg.Surface, pg.mixer.Sound ou bytes
+            Recurso decodificado.
+        """
+
+        if kind == "atlas":
+            try:
+                return pg.image.load(path)
+            except (pg.error, FileNotFoundError) as e:
+                raise eg.ImageLoadError(f"Detalhes do erro: {e}")
+        if kind == "image":
+            return decode_image(path, scale)
+        if kind == "sound":
+            return decode_sound(path)
+        return read_file(path)
+
+    def start(self) -> None:
+        """
+        Método que envia todos os recursos para o pool de threads.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__executor = ThreadPoolExecutor(max_workers=self.__workers)
+        self.__pending = [(job, self.__executor.submit(self.__decode, *job)) for job in self.__jobs]
+
+    def poll(self) -> float:
+        """
+        Método que entrega aos caches os recursos já decodificados (sem esperar pelos demais).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        float
+            Progresso do carregamento, entre 0 e 1.
+        """
+
+        pending = []
+        for (kind, path, scale), future in self.__pending:
+            if not future.done():
+                pending.append(((kind, path, scale), future))
+                continue
+            resource = future.result() # propaga os erros de carregamento na thread principal
+            if kind == "atlas":
+                image_cache.store_atlas(resource, self.__atlas_frames)
+            elif kind == "image":
+                if not image_cache.contains(path, scale):
+                    image_cache.store(path, scale, resource)
+            elif kind == "sound":
+                sound_bank.store(path, resource)
+            else:
+                file_cache.store(path, resource)
+            self.done += 1
+        self.__pending = pending
+
+        if self.finished and self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+        return self.done / self.total if self.total else 1.0
+
+
+# Caches únicos do processo, usados por todos os sprites e interfaces
+image_cache = ImageCache()
+pixel_cache = PixelCache(cst.PIXEL_CACHE_DIR if cst.PIXEL_CACHE else None)
+audio_cache = AudioCache(cst.AUDIO_CACHE_DIR if cst.AUDIO_CACHE else None)
+sound_bank = SoundBank(cst.SOUND_LIMITS)
+file_cache = FileCache()
+text_cache = TextCache()
@@ -3,15 +3,11 @@ Módulo que contém as classes e métodos para a construção dos sprites do jog
 """
 
 # Importando as bibliotecas
-import random
-import time
-import threading
-
 import pygame as pg
 from pygame.locals import *
 
 import constants as cst
-import exception_game as eg
+import resources as rs
 
 
 class Render:
@@ -19,6 +15,8 @@ class Render:
     Classe que renderiza imagens na tela.
     """
 
+    collides = True # atríbuto global para indicar se o sprite participa das colisões (e precisa de máscaras)
+
     def __init__(self, display: pg.Surface, scale: list, path_images: list, *groups) -> None:
         """
         Método constutor da classe Render.
@@ -42,26 +40,69 @@ class Render:
         self._display = display
         if groups:
             self._groups = groups[0]
-        self.__images = [pg.image.load(image) for image in path_images] # conjunto de imagens
-        self.__images = [pg.transform.scale(image, scale) for image in self.__images] # conjunto de imagens escalonadas na tela
+        self.__scale = scale
+        self.__images = rs.image_cache.load_sequence(path_images, scale) # conjunto de imagens escalonadas (compartilhadas entre os sprites)
+        # máscaras de colisão de cada imagem (idem), apenas para os sprites que colidem
+        self.__masks = rs.image_cache.load_mask_sequence(path_images, scale) if self.collides else None
         
         self.image = self.__images[0] # imagem inicial
         self.rect = self.image.get_rect() # definindo o retângulo da imagem
-        self._mask = pg.mask.from_surface(self.image) # definindo a mascara de colisão da imagem
+        self.mask = self.__masks[0] if self.collides else None # máscara de colisão da imagem (usada por pg.sprite.collide_mask)
 
         self.__current_frame = 0 # indíce inicial do conjunto de imagens
         self._animation_speed = 5 # velocidade (quantidade de frames por atualização)
         self._animation_timer = 0 # temporizador
 
-        # repetindo algo semelhante ao que está acima, mas para um conjunto de imagens específicas (explosão de sprites)
-        self.__explosion_frames = [pg.image.load(image) for image in cst.EXPLOSION]
-        self.__explosion_frames = [pg.transform.scale(image, scale) for image in self.__explosion_frames]
-
+        # quadros da explosão: só são buscados no cache quando o sprite de fato explode
+        self.__explosion_frames = None
+        self.__explosion_masks = None
         self.__current_explosion_frame = 0
         self.__explosion_speed = 1
         self.__explosion_timer = 0
         self.exploded = False
 
+        self.visible = True # indica se o sprite deve ser desenhado no quadro atual
+        self._previous_pos = None # posição no tick anterior (usada na interpolação do desenho)
+
+    def save_position(self) -> None:
+        """
+        Método que guarda a posição atual do sprite, antes de um novo tick da simulação.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self._previous_pos = self.rect.topleft
+
+    def draw(self, alpha=1.0) -> list:
+        """
+        Método que desenha o sprite na tela (etapa de renderização, separada da
+        atualização do estado feita em update), interpolando entre a posição do
+        tick anterior e a atual.
+
+        Parameters
+        ----------
+        alpha : float (Opcional)
+            Fração do tempo entre ticks já decorrida (1 desenha na posição atual).
+
+        Returns
+        -------
+        list
+            Lista de regiões da tela alteradas pelo desenho.
+        """
+
+        if not self.visible:
+            return []
+        if self._previous_pos is None:
+            return [self._display.blit(self.image, self.rect)]
+        x, y = self._previous_pos
+        pos = (round(x + (self.rect.x - x) * alpha), round(y + (self.rect.y - y) * alpha))
+        return [self._display.blit(self.image, pos)]
+
     def _animate(self) -> None:
         """
         Método que anima os sprites segundo o conjunto de imagens fornecido.
@@ -80,6 +121,8 @@ class Render:
             self._animation_timer = 0
             self.__current_frame = (self.__current_frame + 1) % len(self.__images) # novo indíce do conjunto de imagens
             self.image = self.__images[self.__current_frame] # nova imagem
+            if self.collides:
+                self.mask = self.__masks[self.__current_frame] # nova máscara
 
     def _animate_explosion(self) -> None:
         """
@@ -95,17 +138,16 @@ class Render:
 
         # som de explosão
         if self.__current_explosion_frame == 0:
-            try:
-                explosion_sound = pg.mixer.Sound(cst.EXPLOSION_SOUND)
-                explosion_sound.play()
-            except pg.error as e:
-                raise eg.SoundLoadError(f"Detalhes do erro: {e}")
+            self.__explosion_frames = rs.image_cache.load_sequence(cst.EXPLOSION, self.__scale)
+            self.__explosion_masks = rs.image_cache.load_mask_sequence(cst.EXPLOSION, self.__scale)
+            rs.sound_bank.play(cst.EXPLOSION_SOUND)
 
         if self.__current_explosion_frame < len(self.__explosion_frames):
             self.__explosion_timer += 1
             if self.__explosion_timer >= self.__explosion_speed:
                 self.__explosion_timer = 0
                 self.image = self.__explosion_frames[self.__current_explosion_frame]
+                self.mask = self.__explosion_masks[self.__current_explosion_frame]
                 self.__current_explosion_frame += 1
 
         # morte do sprite
@@ -118,9 +160,11 @@ class Background(pg.sprite.Sprite, Render):
     Classe de Sprite(s) para o cenário do jogo.
     """
 
-    def __init__(self, display: pg.Surface, scale: list, path_images: list, *groups) -> None:
+    collides = False # o cenário nunca colide (não monta máscaras)
+
+    def __init__(self, display: pg.Surface, scale: list, path_images: list, *groups, parallax=None) -> None:
         """
-        Método constutor da classe Boss.
+        Método constutor da classe Background.
 
         Parameters
         ----------
@@ -132,6 +176,9 @@ class Background(pg.sprite.Sprite, Render):
             Lista contendo o conjunto de imagens do sprite.
         groups : pg.sprite.Group
             Conjunto de grupos que o sprite pertence.
+        parallax : list (Opcional)
+            Lista de tuplas (caminho da imagem, velocidade) com camadas extras
+            (com transparência) desenhadas sobre o cenário.
         
         Returns
         -------
@@ -142,8 +189,41 @@ class Background(pg.sprite.Sprite, Render):
         Render.__init__(self, display, scale, path_images, *groups)
         
         self.__pos_width = self._display.get_width()
+        self.__previous_pos_width = self.__pos_width
         self.__speed = 1 # velocidade de movimento do background
 
+        # camadas do cenário: [faixa dupla, velocidade, janela visível], montadas uma única vez
+        self.__layers = [[self.__build_strip(self.image, False), self.__speed, self.image.get_rect()]]
+        for path, speed in parallax or []:
+            image = rs.image_cache.load(path, scale)
+            self.__layers.append([self.__build_strip(image, True), speed, image.get_rect()])
+
+    def __build_strip(self, image: pg.Surface, alpha: bool) -> pg.Surface:
+        """
+        Método que monta uma faixa com a imagem repetida duas vezes lado a lado,
+        de forma que qualquer deslocamento seja uma única janela contínua da faixa.
+
+        Parameters
+        ----------
+        image : pg.Surface
+            Imagem da camada.
+        alpha : bool
+            Indica se a camada tem transparência.
+
+        Returns
+        -------
+        pg.Surface
+            Faixa com o dobro da largura da imagem.
+        """
+
+        width, height = image.get_size()
+        strip = pg.Surface((width * 2, height), pg.SRCALPHA if alpha else 0)
+        strip.blit(image, (0, 0))
+        strip.blit(image, (width, 0))
+        if pg.display.get_surface() is not None:
+            strip = strip.convert_alpha() if alpha else strip.convert()
+        return strip
+
     def update(self) -> None:
         """
         Método que atualiza o background para movimentar-se enquanto o jogador
@@ -157,21 +237,103 @@ class Background(pg.sprite.Sprite, Render):
         None.
         """
 
-        self._display.blit(self.image, (0, 0))
-
-        rel_x = self.__pos_width % self.image.get_rect().width # efeito contínuo de deslocamento horizontal
-        self._display.blit(self.image, (rel_x - self.image.get_rect().width, 0)) # redesenha a imagem na tela
-        if rel_x < cst.WIDTH:
-            self._display.blit(self.image, (rel_x, 0))
         self.__pos_width -= self.__speed
 
+    def save_position(self) -> None:
+        """
+        Método que guarda o deslocamento atual do background, antes de um novo tick da simulação.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__previous_pos_width = self.__pos_width
+
+    def draw(self, alpha=1.0) -> list:
+        """
+        Método que desenha o background deslocado na tela (um blit por camada).
+
+        Parameters
+        ----------
+        alpha : float (Opcional)
+            Fração do tempo entre ticks já decorrida (usada para interpolar o deslocamento).
+
+        Returns
+        -------
+        list
+            Lista de regiões da tela alteradas pelo desenho (a tela inteira).
+        """
+
+        pos_width = self.__previous_pos_width + (self.__pos_width - self.__previous_pos_width) * alpha
+        for strip, speed, window in self.__layers:
+            # deslocamento contínuo da camada: a janela percorre a faixa dupla da direita para a esquerda
+            window.x = int(-pos_width * speed // self.__speed) % window.width
+            self._display.blit(strip, (0, 0), window)
+        return [self._display.get_rect()]
+
+
+class LivesHUD:
+    """
+    Classe que desenha a fileira de vidas do player, composta em uma única
+    superfície que só é refeita quando a quantidade de vidas muda.
+    """
+
+    def __init__(self, display: pg.Surface, pos: tuple) -> None:
+        """
+        Método constutor da classe LivesHUD.
+
+        Parameters
+        ----------
+        display : pg.Surface
+            Tela onde acontece o jogo.
+        pos : tuple
+            Tupla contendo a posição x e y da primeira vida.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__display = display
+        self.__pos = pos
+        self.__heart = rs.image_cache.load(cst.ITEM_LIFE[0], cst.SCALE_LIFE) # imagem escalonada da vida (compartilhada)
+        self.__lifes = None # quantidade de vidas da fileira composta
+        self.__row = None
+
+    def draw(self, lifes: int) -> pg.Rect:
+        """
+        Método que desenha a fileira de vidas com um único blit.
+
+        Parameters
+        ----------
+        lifes : int
+            Quantidade de vidas do player.
+
+        Returns
+        -------
+        pg.Rect
+            Região da tela ocupada pelas vidas.
+        """
+
+        if lifes != self.__lifes:
+            self.__lifes = lifes
+            width = self.__heart.get_width()
+            self.__row = pg.Surface((width * max(lifes, 0), self.__heart.get_height()), pg.SRCALPHA)
+            for n in range(lifes):
+                self.__row.blit(self.__heart, (width * n, 0))
+        return self.__display.blit(self.__row, self.__pos)
+
 
 class Player(pg.sprite.Sprite, Render):
     """
     Classe de Sprite(s) para o player (jogador) do jogo.
     """
 
-    def __init__(self, display: pg.Surface, scale: list, path_images: list, *groups, group_shoot: pg.sprite.Group) -> None:
+    def __init__(self, display: pg.Surface, scale: list, path_images: list, *groups, group_shoot: pg.sprite.Group, scheduler, controls) -> None:
         """
         Método constutor da classe Player.
 
@@ -187,6 +349,10 @@ class Player(pg.sprite.Sprite, Render):
             Conjunto de grupos que o sprite pertence.
         group_shoot: pg.sprite.Group
             Sprite do tiro que será utilizado pelo player.
+        scheduler : timing.EffectScheduler
+            Agendador dos efeitos temporários (duração dos itens).
+        controls : controls.Controls
+            Fonte de entrada (teclas lidas uma vez por tick pelo jogo).
         
         Returns
         -------
@@ -206,9 +372,12 @@ class Player(pg.sprite.Sprite, Render):
 
         self.shooting_enabled = True
         self.increase_speed_enabled = True
+        self.__scheduler = scheduler
+        self.__controls = controls
 
         self.damaged = False # indicador de que o player levou dano
         self.lifes = 3
+        self.__lifes_hud = LivesHUD(self._display, (20, 20))
         self.__speed = 30
         self._animation_speed = 10
 
@@ -224,19 +393,34 @@ class Player(pg.sprite.Sprite, Render):
         None.
         """
 
-        if self.damaged:
-            self.damaged = False
-        else:
-            self._display.blit(self.image, (self.rect.x, self.rect.y))
+        # o player pisca (não é desenhado) no quadro em que leva dano
+        self.visible = not self.damaged
+        self.damaged = False
 
-        self.__keys = pg.key.get_pressed()
+        self.__keys = self.__controls.state
 
         self._animate()
         if self._animation_speed >= 2:
             self._animation_speed -= 0.05 # efetio contínuo de aumento da velocidade
         self.__movements()
         self.__shoot_player()
-        self.__draw_lifes()
+
+    def draw(self, alpha=1.0) -> list:
+        """
+        Método que desenha o player e suas vidas na tela.
+
+        Parameters
+        ----------
+        alpha : float (Opcional)
+            Fração do tempo entre ticks já decorrida (usada na interpolação).
+
+        Returns
+        -------
+        list
+            Lista de regiões da tela alteradas pelo desenho.
+        """
+
+        return Render.draw(self, alpha) + [self.__draw_lifes()]
 
     def __movements(self) -> None:
         """
@@ -292,7 +476,7 @@ class Player(pg.sprite.Sprite, Render):
         if self.rect.right > self._display.get_width():
             self.rect.right = self._display.get_width()
 
-    def __draw_lifes(self) -> None:
+    def __draw_lifes(self) -> pg.Rect:
         """
         Método que desenha no canto superior esquerdo da tela as vidas que o player tem.
                 
@@ -301,13 +485,11 @@ class Player(pg.sprite.Sprite, Render):
 
         Returns
         -------
-        None.
+        pg.Rect
+            Região da tela ocupada pelas vidas.
         """
 
-        life = Render(self._display, cst.SCALE_LIFE, cst.ITEM_LIFE, self._groups[0])
-
-        for n in range(self.lifes):
-            life._display.blit(life.image, (20 + 50 * n, 20))
+        return self.__lifes_hud.draw(self.lifes)
 
     def __shoot_player(self) -> None:
         """
@@ -325,7 +507,7 @@ class Player(pg.sprite.Sprite, Render):
         if self.__timer_shoot > self.__timer_shoot_max:
             if self.__keys[K_j]:
                 self.__timer_shoot = 0
-                Shoot(self._display, cst.SCALE_SHOOT, cst.SHOOT_PLAYER, self.rect.topright, self.__speed, False, (self._groups[0], self.__group_shoot))
+                Shoot.spawn(self._display, cst.SCALE_SHOOT, cst.SHOOT_PLAYER, self.rect.topright, self.__speed, False, (self._groups[0], self.__group_shoot))
 
     def increase_fire_rate(self) -> None:
         """
@@ -342,13 +524,12 @@ class Player(pg.sprite.Sprite, Render):
         self.shooting_enabled = False
         self.__timer_shoot_max = 1
 
-        # Inicia um temporizador para voltar ao tempo de tiro original após 15 segundos
-        self.reset_timer = threading.Timer(15, self.__reset_fire_rate)
-        self.reset_timer.start()
+        # Volta ao tempo de tiro original ao fim da duração do item
+        self.__scheduler.apply("fire_rate", cst.ITEM_DURATION, self.__reset_fire_rate, cst.ITEM_EFFECT_MODE)
 
     def __reset_fire_rate(self) -> None:
         """
-        Método chamado pelo temporizador para reverter as alterações após a duração.
+        Método chamado pelo agendador, ao fim da duração do item, para reverter as alterações.
                 
         Parameters
         ----------
@@ -377,13 +558,12 @@ class Player(pg.sprite.Sprite, Render):
         self.__speed = 60
         self._animation_speed = 1
 
-        # Inicia um temporizador para voltar a velocidade original após 15 segundos
-        self.reset_speed_timer = threading.Timer(15, self.__reset_speed)
-        self.reset_speed_timer.start()
+        # Volta à velocidade original ao fim da duração do item
+        self.__scheduler.apply("speed", cst.ITEM_DURATION, self.__reset_speed, cst.ITEM_EFFECT_MODE)
 
     def __reset_speed(self) -> None:
         """
-        Método chamado pelo temporizador para reverter as alterações após a duração.
+        Método chamado pelo agendador, ao fim da duração do item, para reverter as alterações.
                 
         Parameters
         ----------
@@ -419,7 +599,7 @@ class Obstacle(pg.sprite.Sprite, Render):
 
     is_boss = False # atríbuto global para indicar se há um boss (obstáculos e boss não atuam simultaneamente)
 
-    def __init__(self, display: pg.Surface, scale: list, path_images: list, speed_increment: float, *groups, group_shoot: pg.sprite.Group) -> None:
+    def __init__(self, display: pg.Surface, scale: list, path_images: list, speed_increment: float, *groups, group_shoot: pg.sprite.Group, rng) -> None:
         """
         Método constutor da classe Obstacle.
 
@@ -437,6 +617,8 @@ class Obstacle(pg.sprite.Sprite, Render):
             Conjunto de grupos que o sprite pertence.
         group_shoot: pg.sprite.Group
             Sprite do tiro que será utilizado pelo obstáculo.
+        rng : random.Random
+            Sequência de números aleatórios da partida.
         
         Returns
         -------
@@ -447,14 +629,15 @@ class Obstacle(pg.sprite.Sprite, Render):
         Render.__init__(self, display, scale, path_images, *groups)
 
         self.__group_shoot = group_shoot
+        self.__rng = rng
         self.rect.x = self._display.get_width()
-        self.rect.y = random.randint(0, display.get_height() - scale[1]) # posição aleatória em relação a altura da tela
+        self.rect.y = self.__rng.randint(0, display.get_height() - scale[1]) # posição aleatória em relação a altura da tela
 
         self.timer_shoot = 0
         self.__timer_shoot_max = 50
         self.__min_speed, self.__max_speed = 20, 30 # constantes que randomizam a velocidade dos obstáculos
         self.__speed_increment = speed_increment
-        self.speed = self.__speed_increment / 5 + random.randint(self.__min_speed, self.__max_speed)
+        self.speed = self.__speed_increment / 5 + self.__rng.randint(self.__min_speed, self.__max_speed)
 
     def update(self) -> None:
         """
@@ -470,8 +653,6 @@ class Obstacle(pg.sprite.Sprite, Render):
         """
 
         if not self.rect.right < 0 and not self.exploded:
-            self._display.blit(self.image, (self.rect.x, self.rect.y))
-
             self.rect.x -= self.speed
 
             if not self.is_boss:
@@ -479,7 +660,6 @@ class Obstacle(pg.sprite.Sprite, Render):
             self.__shoot_obstacles()
             self._animate()
         elif self.exploded: # o surgimento do boss explode os obstáculos existentes na tela
-            self._display.blit(self.image, (self.rect.x, self.rect.y))
             self._animate_explosion()
 
         if self.rect.right < 0 or self.exploded:
@@ -497,11 +677,11 @@ class Obstacle(pg.sprite.Sprite, Render):
         None.
         """
 
-        new_obstacles = random.randint(1, 4) # quantidade aleatória entre 1 e 4 obstáculos a ser gerada
+        new_obstacles = self.__rng.randint(1, 4) # quantidade aleatória entre 1 e 4 obstáculos a ser gerada
         if len(self._groups[1].sprites()) <= 2: # condição para ter mais obstáculos (veja que o máximo tem que ser 2 + 4 = 6)
-            if random.random() < 0.03: # probabilidade de 3% de gerar mais obstáculos
+            if self.__rng.random() < 0.03: # probabilidade de 3% de gerar mais obstáculos
                 for _ in range(new_obstacles):
-                    Obstacle(self._display, cst.SCALE_OBSTACLE, cst.OBSTACLE, self.__speed_increment, (self._groups[0], self._groups[1]), group_shoot=self.__group_shoot)
+                    Obstacle(self._display, cst.SCALE_OBSTACLE, cst.OBSTACLE, self.__speed_increment, (self._groups[0], self._groups[1]), group_shoot=self.__group_shoot, rng=self.__rng)
 
     def __shoot_obstacles(self) -> None:
         """
@@ -518,9 +698,9 @@ class Obstacle(pg.sprite.Sprite, Render):
         self.timer_shoot += 1
         if self.timer_shoot > self.__timer_shoot_max:
             self.timer_shoot = 0
-            obstacles_choice = random.sample(self._groups[1].sprites(), random.randint(0, len(self._groups[1].sprites()))) # escolhe uma amostra da quantidade de obstáculos na tela para atirar
+            obstacles_choice = self.__rng.sample(self._groups[1].sprites(), self.__rng.randint(0, len(self._groups[1].sprites()))) # escolhe uma amostra da quantidade de obstáculos na tela para atirar
             for oc in obstacles_choice:
-                Shoot(self._display, cst.SCALE_SHOOT, cst.SHOOT_OBSTACLE, (oc.rect.left, oc.rect.centery), oc.speed, True, (self._groups[0], self.__group_shoot))
+                Shoot.spawn(self._display, cst.SCALE_SHOOT, cst.SHOOT_OBSTACLE, (oc.rect.left, oc.rect.centery), oc.speed, True, (self._groups[0], self.__group_shoot))
             for ob in self._groups[1].sprites():
                 ob.timer_shoot = 0
 
@@ -530,6 +710,8 @@ class Shoot(pg.sprite.Sprite, Render):
     Classe de Sprite(s) para os disparos (tiros) do jogo.
     """
 
+    pool = None # atríbuto global com o pool de tiros reutilizáveis (definido pelo jogo)
+
     def __init__(self, display: pg.Surface, scale: int, path_images: list, pos: tuple, speed_sprite: float, is_obstacle=False, *groups) -> None:
         """
         Método constutor da classe Shoot.
@@ -556,7 +738,43 @@ class Shoot(pg.sprite.Sprite, Render):
         None.
         """
 
-        pg.sprite.Sprite.__init__(self, *groups)
+        pg.sprite.Sprite.__init__(self)
+        self._pool = None # pool ao qual o tiro é devolvido quando destruído
+        self.reset(display, scale, path_images, pos, speed_sprite, is_obstacle, *groups)
+
+    @classmethod
+    def spawn(cls, display: pg.Surface, scale: int, path_images: list, pos: tuple, speed_sprite: float, is_obstacle=False, *groups):
+        """
+        Método que dispara um tiro, reaproveitando um objeto do pool quando houver um.
+
+        Parameters
+        ----------
+        (os mesmos do método construtor)
+
+        Returns
+        -------
+        Shoot
+            Tiro disparado (ou None, caso o pool esteja cheio e descarte o tiro).
+        """
+
+        if cls.pool is None:
+            return cls(display, scale, path_images, pos, speed_sprite, is_obstacle, *groups)
+        return cls.pool.acquire(display, scale, path_images, pos, speed_sprite, is_obstacle, *groups)
+
+    def reset(self, display: pg.Surface, scale: int, path_images: list, pos: tuple, speed_sprite: float, is_obstacle=False, *groups) -> None:
+        """
+        Método que (re)inicia o tiro, devolvendo-o aos seus grupos na posição indicada.
+
+        Parameters
+        ----------
+        (os mesmos do método construtor)
+
+        Returns
+        -------
+        None.
+        """
+
+        self.add(*groups)
         Render.__init__(self, display, scale, path_images, *groups)
 
         self.__is_obstacle = is_obstacle # deve ser verdadeiro para obstáculos ou boss
@@ -564,14 +782,27 @@ class Shoot(pg.sprite.Sprite, Render):
         self.rect.y = pos[1]
 
         # som do tiro
-        try:
-            shoot_sound = pg.mixer.Sound(cst.SHOOT_SOUND)
-            shoot_sound.play()
-        except pg.error as e:
-            raise eg.SoundLoadError(f"Detalhes do erro: {e}")
+        rs.sound_bank.play(cst.SHOOT_SOUND)
 
         self.__speed = speed_sprite + 5
 
+    def kill(self) -> None:
+        """
+        Método que remove o tiro de todos os grupos e o devolve ao pool.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        was_alive = self.alive()
+        pg.sprite.Sprite.kill(self)
+        if was_alive and self._pool is not None:
+            self._pool.release(self)
+
     def update(self) -> None:
         """
         Método que atualiza os movimentos do tiro, que estão
@@ -585,8 +816,6 @@ class Shoot(pg.sprite.Sprite, Render):
         None.
         """
 
-        self._display.blit(self.image, (self.rect.x, self.rect.y))
-
         self._animate()
 
         if self.__is_obstacle: # tiro do obstáculo ou do boss
@@ -606,7 +835,7 @@ class Boss(pg.sprite.Sprite, Render):
     Classe de Sprite(s) para o boss do jogo.
     """
 
-    def __init__(self, display: pg.Surface, scale: list, path_images: list, speed_increment: float, lifes: int, *groups, group_shoot: pg.sprite.Group) -> None:
+    def __init__(self, display: pg.Surface, scale: list, path_images: list, speed_increment: float, lifes: int, *groups, group_shoot: pg.sprite.Group, clock, rng) -> None:
         """
         Método constutor da classe Boss.
 
@@ -626,6 +855,10 @@ class Boss(pg.sprite.Sprite, Render):
             Conjunto de grupos que o sprite pertence.
         group_shoot: pg.sprite.Group
             Sprite do tiro que será utilizado pelo boss.
+        clock : timing.SimulationClock
+            Relógio da simulação (usado no intervalo entre os tiros).
+        rng : random.Random
+            Sequência de números aleatórios da partida.
         
         Returns
         -------
@@ -645,20 +878,18 @@ class Boss(pg.sprite.Sprite, Render):
         self._animation_speed = 8
 
         self.__group_shoot = group_shoot
+        self.__clock = clock
+        self.__rng = rng
         self.__last_shoot_time = 0
-        self.__start_time = time.time()
+        self.__start_time = self.__clock.now
 
         self.lifes = lifes
         self.damaged = False # indicador de que o boss levou dano
 
         # som de entrada do boss
-        try:
-            boss_sound = pg.mixer.Sound(cst.BOSS_SOUND)
-            boss_sound.play()
-        except pg.error as e:
-            raise eg.SoundLoadError(f"Detalhes do erro: {e}")
+        rs.sound_bank.play(cst.BOSS_SOUND)
 
-    def __draw_life(self) -> None:
+    def __draw_life(self) -> pg.Rect:
         """
         Método que desenha no canto inferior direito da tela uma barra vermelha com a vida do boss.
                 
@@ -667,11 +898,12 @@ class Boss(pg.sprite.Sprite, Render):
 
         Returns
         -------
-        None.
+        pg.Rect
+            Região da tela ocupada pela barra.
         """
 
         bar_life_width = int((self.lifes / 10) * 200)
-        pg.draw.rect(self._display, cst.RED, (self._display.get_width() - bar_life_width - 10, self._display.get_height() - 50, bar_life_width, 10))
+        return pg.draw.rect(self._display, cst.RED, (self._display.get_width() - bar_life_width - 10, self._display.get_height() - 50, bar_life_width, 10))
 
     def __shoot_boss(self) -> None:
         """
@@ -685,12 +917,12 @@ class Boss(pg.sprite.Sprite, Render):
         None.
         """
         
-        current_time = time.time() + 2
+        current_time = self.__clock.now + 2
         time_on_screen = current_time - self.__start_time
 
         if time_on_screen >= 5 and current_time - self.__last_shoot_time >= 2:
                 self.__last_shoot_time = current_time
-                Shoot(self._display, cst.SCALE_SHOOT_BOSS, cst.SHOOT_BOSS, (self.rect.left, random.uniform(self.rect.top, self.rect.bottom)), self.__speed, True, (self._groups[0], self.__group_shoot))
+                Shoot.spawn(self._display, cst.SCALE_SHOOT_BOSS, cst.SHOOT_BOSS, (self.rect.left, self.__rng.uniform(self.rect.top, self.rect.bottom)), self.__speed, True, (self._groups[0], self.__group_shoot))
 
     def update(self) -> None:
         """
@@ -705,10 +937,9 @@ class Boss(pg.sprite.Sprite, Render):
         None.
         """
 
-        if self.damaged:
-            self.damaged = False
-        else:
-            self._display.blit(self.image, (self.rect.x, self.rect.y))
+        # o boss pisca (não é desenhado) no quadro em que leva dano
+        self.visible = not self.damaged
+        self.damaged = False
 
         self.rect.x -= self.speedx
 
@@ -726,10 +957,8 @@ class Boss(pg.sprite.Sprite, Render):
                 elif self.__verificate_speedy == "UP":
                     self.rect.y -= self.__speedy
                 self._animate()
-                self.__draw_life()
                 self.__shoot_boss()
             else:
-                self._display.blit(self.image, (self.rect.x, self.rect.y))
                 self._animate_explosion()
 
         if self.lifes <= 0:
@@ -738,14 +967,34 @@ class Boss(pg.sprite.Sprite, Render):
 
         if self.exploded:
             self._groups[1].remove(self)
-            
+
+    def draw(self, alpha=1.0) -> list:
+        """
+        Método que desenha o boss e, após a sua entrada, a barra de vida.
+
+        Parameters
+        ----------
+        alpha : float (Opcional)
+            Fração do tempo entre ticks já decorrida (usada na interpolação).
+
+        Returns
+        -------
+        list
+            Lista de regiões da tela alteradas pelo desenho.
+        """
+
+        rects = Render.draw(self, alpha)
+        if self.speedx == 0 and not self.exploded:
+            rects.append(self.__draw_life())
+        return rects
+
 
 class Items(pg.sprite.Sprite, Render):
     """
     Classe de sprite(s) para os itens do jogo.
     """
 
-    def __init__(self, display: pg.Surface, scale: list, path_images: list, item_type: str, *groups, player: pg.sprite.Group) -> None:
+    def __init__(self, display: pg.Surface, scale: list, path_images: list, item_type: str, *groups, player: pg.sprite.Group, rng) -> None:
         """
         Método constutor da classe Items.
 
@@ -763,6 +1012,8 @@ class Items(pg.sprite.Sprite, Render):
             Conjunto de grupos que o sprite pertence.
         player: pg.sprite.Group
             Sprite do Player que irá receber o item.
+        rng : random.Random
+            Sequência de números aleatórios da partida.
         
         Returns
         -------
@@ -773,7 +1024,7 @@ class Items(pg.sprite.Sprite, Render):
         Render.__init__(self, display, scale, path_images, *groups)
         
         self.rect.x = self._display.get_width()
-        self.rect.y = random.randint(0, display.get_height() - scale[1])
+        self.rect.y = rng.randint(0, display.get_height() - scale[1])
 
         self.__speed = 5
         self._animation_speed = 1
@@ -812,11 +1063,118 @@ class Items(pg.sprite.Sprite, Render):
         None.
         """
 
-        self._display.blit(self.image, (self.rect.x, self.rect.y))
-
         self.rect.x -= self.__speed
 
         self._animate()
 
         if self.rect.right < 0:
             self.kill()
+
+
+class ShootPool:
+    """
+    Classe que recicla os objetos de tiro (e seus grupos), evitando criar e
+    descartar um Shoot a cada disparo.
+    """
+
+    def __init__(self, capacity: int, overflow="grow") -> None:
+        """
+        Método construtor da classe ShootPool.
+
+        Parameters
+        ----------
+        capacity : int
+            Quantidade máxima de tiros mantidos pelo pool.
+        overflow : str (Opcional)
+            Política quando todos os tiros estão em uso: "grow" (cria um tiro extra),
+            "drop" (descarta o novo tiro) ou "recycle" (reaproveita o tiro mais antigo).
+
+        Returns
+        -------
+        None.
+        """
+
+        if overflow not in ("grow", "drop", "recycle"):
+            raise ValueError(f"Política de overflow inválida: {overflow}")
+
+        self.__capacity = capacity
+        self.__overflow = overflow
+        self.__free = [] # tiros disponíveis para reuso
+        self.__active = {} # tiros em uso, na ordem de disparo (dicionário usado como conjunto ordenado)
+
+        self.created = 0 # tiros criados
+        self.reused = 0 # tiros reaproveitados do pool
+        self.recycled = 0 # tiros em uso tomados pela política "recycle"
+        self.dropped = 0 # tiros descartados pela política "drop"
+        self.overflows = 0 # vezes em que o pool estava cheio
+        self.peak_active = 0 # maior quantidade de tiros simultâneos
+
+    def acquire(self, display: pg.Surface, scale: int, path_images: list, pos: tuple, speed_sprite: float, is_obstacle=False, *groups) -> Shoot:
+        """
+        Método que entrega um tiro pronto para uso (reaproveitado ou novo).
+
+        Parameters
+        ----------
+        (os mesmos do método construtor de Shoot)
+
+        Returns
+        -------
+        Shoot
+            Tiro disparado (ou None, caso a política seja "drop" e o pool esteja cheio).
+        """
+
+        if not self.__free and len(self.__active) >= self.__capacity:
+            self.overflows += 1
+            if self.__overflow == "drop":
+                self.dropped += 1
+                return None
+            if self.__overflow == "recycle":
+                self.recycled += 1
+                next(iter(self.__active)).kill() # o tiro mais antigo volta para a lista de livres
+
+        if self.__free:
+            shoot = self.__free.pop()
+            shoot.reset(display, scale, path_images, pos, speed_sprite, is_obstacle, *groups)
+            self.reused += 1
+        else:
+            shoot = Shoot(display, scale, path_images, pos, speed_sprite, is_obstacle, *groups)
+            shoot._pool = self
+            self.created += 1
+
+        self.__active[shoot] = None
+        self.peak_active = max(self.peak_active, len(self.__active))
+        return shoot
+
+    def release(self, shoot: Shoot) -> None:
+        """
+        Método que devolve ao pool um tiro que foi destruído.
+
+        Parameters
+        ----------
+        shoot : Shoot
+            Tiro destruído.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__active.pop(shoot, None)
+        if len(self.__free) < self.__capacity:
+            self.__free.append(shoot)
+
+    def stats(self) -> dict:
+        """
+        Método que informa o uso do pool.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        dict
+            Dicionário com as estatísticas do pool.
+        """
+
+        return {"capacity": self.__capacity, "active": len(self.__active), "free": len(self.__free), "peak_active": self.peak_active,
+                "created": self.created, "reused": self.reused, "recycled": self.recycled, "dropped": self.dropped, "overflows": self.overflows}
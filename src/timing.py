@@ -0,0 +1,274 @@
+"""
+Módulo que contém o relógio da simulação, única fonte de tempo do jogo, e o
+agendador dos efeitos temporários.
+"""
+
+# Importando as bibliotecas
+import heapq
+
+import pygame as pg
+
+
+class SimulationClock:
+    """
+    Classe que mede o tempo real dos quadros e o converte em ticks de duração fixa.
+    O tempo do jogo (em segundos) é sempre a quantidade de ticks simulados vezes a
+    duração de um tick: ele para junto com o jogo e pode correr mais rápido que o
+    tempo real (modo acelerado, um tick por quadro sem limite de quadros).
+    """
+
+    def __init__(self, tick_rate: int, max_frame_time: float, fast_forward=False) -> None:
+        """
+        Método construtor da classe SimulationClock.
+
+        Parameters
+        ----------
+        tick_rate : int
+            Quantidade de ticks da simulação por segundo.
+        max_frame_time : float
+            Tempo real máximo (s) de um quadro considerado pela simulação.
+        fast_forward : bool (Opcional)
+            Se verdadeiro, a simulação não espera pelo tempo real.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.tick_rate = tick_rate
+        self.tick_time = 1 / tick_rate # duração (s) de um tick
+        self.fast_forward = fast_forward
+        self.paused = False
+        self.ticks = 0 # ticks simulados desde o início da partida
+
+        self.__max_frame_time = max_frame_time
+        self.__accumulator = 0.0 # tempo real ainda não convertido em ticks
+        self.__real_clock = pg.time.Clock()
+
+    @property
+    def now(self) -> float:
+        """
+        Tempo (s) da simulação.
+        """
+
+        return self.ticks * self.tick_time
+
+    @property
+    def alpha(self) -> float:
+        """
+        Fração do tempo entre o último tick e o próximo já decorrida (usada na interpolação).
+        """
+
+        if self.fast_forward:
+            return 1.0
+        return self.__accumulator / self.tick_time
+
+    def reset(self) -> None:
+        """
+        Método que zera o tempo da simulação (início de uma nova partida).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.ticks = 0
+        self.paused = False
+        self.__accumulator = 0.0
+        self.__real_clock.tick() # descarta o tempo real anterior
+
+    def frame(self, fps: int) -> int:
+        """
+        Método que encerra um quadro (limitando-o a fps quadros por segundo) e devolve
+        quantos ticks devem ser simulados antes de desenhá-lo.
+
+        Parameters
+        ----------
+        fps : int
+            Limite de quadros por segundo (ignorado no modo acelerado).
+
+        Returns
+        -------
+        int
+            Quantidade de ticks a simular.
+        """
+
+        if self.fast_forward:
+            self.__real_clock.tick()
+            return 0 if self.paused else 1
+
+        # tempo real do quadro (limitado, para que um quadro lento não gere uma rajada de ticks)
+        frame_time = min(self.__real_clock.tick(fps) / 1000, self.__max_frame_time)
+        if self.paused:
+            return 0
+
+        self.__accumulator += frame_time
+        ticks = int(self.__accumulator // self.tick_time)
+        self.__accumulator -= ticks * self.tick_time
+        return ticks
+
+    def step(self) -> None:
+        """
+        Método que avança a simulação em um tick.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.ticks += 1
+
+    def pause(self) -> None:
+        """
+        Método que congela o tempo da simulação.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.paused = True
+
+    def resume(self) -> None:
+        """
+        Método que retoma o tempo da simulação, descartando o tempo real em que ficou parado.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.paused = False
+        self.__real_clock.tick()
+
+
+class EffectScheduler:
+    """
+    Classe que controla os efeitos temporários do jogo (por exemplo, os itens do
+    player) em uma fila de prioridade (min-heap) de expirações, medidas em ticks da
+    simulação. Tudo acontece na thread do jogo, uma vez por tick.
+    """
+
+    def __init__(self, clock: SimulationClock) -> None:
+        """
+        Método construtor da classe EffectScheduler.
+
+        Parameters
+        ----------
+        clock : SimulationClock
+            Relógio da simulação.
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__clock = clock
+        self.__heap = [] # entradas (tick de expiração, ordem de criação, chave)
+        self.__active = {} # chave -> [tick de expiração, função chamada ao expirar]
+        self.__order = 0 # desempate entre expirações no mesmo tick (ordem de aplicação)
+
+    def apply(self, key: str, seconds: float, on_expire, mode="refresh") -> int:
+        """
+        Método que aplica (ou renova) um efeito temporário.
+
+        Parameters
+        ----------
+        key : str
+            Identificador do efeito.
+        seconds : float
+            Duração do efeito, em segundos da simulação.
+        on_expire : callable
+            Função chamada (sem argumentos) quando o efeito expira.
+        mode : str (Opcional)
+            O que fazer se o efeito já estiver ativo: "refresh" reinicia a duração,
+            "stack" soma a nova duração ao tempo restante.
+
+        Returns
+        -------
+        int
+            Tick em que o efeito expira.
+        """
+
+        if mode not in ("refresh", "stack"):
+            raise ValueError(f"Modo de efeito inválido: {mode}")
+
+        duration = round(seconds * self.__clock.tick_rate)
+        effect = self.__active.get(key)
+        if effect is not None and mode == "stack":
+            expire = effect[0] + duration
+        else:
+            expire = self.__clock.ticks + duration
+
+        # a entrada antiga continua no heap e é descartada ao sair (não bate com o tick ativo)
+        self.__active[key] = [expire, on_expire]
+        heapq.heappush(self.__heap, (expire, self.__order, key))
+        self.__order += 1
+        return expire
+
+    def remaining(self, key: str) -> int:
+        """
+        Método que devolve quantos ticks faltam para um efeito expirar.
+
+        Parameters
+        ----------
+        key : str
+            Identificador do efeito.
+
+        Returns
+        -------
+        int
+            Ticks restantes (0 se o efeito não estiver ativo).
+        """
+
+        effect = self.__active.get(key)
+        if effect is None:
+            return 0
+        return max(effect[0] - self.__clock.ticks, 0)
+
+    def update(self) -> None:
+        """
+        Método que expira os efeitos vencidos até o tick atual (chamado uma vez por tick).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        while self.__heap and self.__heap[0][0] <= self.__clock.ticks:
+            expire, _, key = heapq.heappop(self.__heap)
+            effect = self.__active.get(key)
+            if effect is None or effect[0] != expire:
+                continue # entrada substituída por uma renovação do efeito
+            del self.__active[key]
+            effect[1]()
+
+    def clear(self) -> None:
+        """
+        Método que descarta todos os efeitos (sem chamar as funções de expiração).
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        None.
+        """
+
+        self.__heap.clear()
+        self.__active.clear()